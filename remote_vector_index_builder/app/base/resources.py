@@ -77,16 +77,21 @@ class ResourceManager:
 
         Returns:
             float: Amount of available GPU memory in bytes
+
+        Note:
+            The lock is not taken: reading a single attribute is atomic, and allocate and
+            release only ever rebind it to a new value under the lock.
         """
-        with self._lock:
-            return self._available_gpu_memory
+        return self._available_gpu_memory
 
     def get_available_cpu_memory(self) -> float:
         """
-        Get the current amount of available GPU memory.
+        Get the current amount of available CPU memory.
 
         Returns:
-            float: Amount of available GPU memory in bytes
+            float: Amount of available CPU memory in bytes
+
+        Note:
+            As with get_available_gpu_memory, the attribute is read without taking the lock.
         """
-        with self._lock:
-            return self._available_cpu_memory
+        return self._available_cpu_memory
@@ -87,17 +87,21 @@ class WorkflowExecutor:
             This method is intended to be run in a separate thread.
         """
 
-        logger.debug(
-            f"Worker resource status before allocating memory for job id {workflow.job_id}: - "
-            f"GPU: {self._resource_manager.get_available_gpu_memory():,} bytes, "
-            f"CPU: {self._resource_manager.get_available_cpu_memory():,} bytes"
-        )
-
-        logger.debug(
-            f"Allocating memory for job id {workflow.job_id}: - "
-            f"GPU: {workflow.gpu_memory_required:,} bytes, "
-            f"CPU: {workflow.cpu_memory_required:,} bytes"
-        )
+        # The messages use thousands separators, which need eager formatting, so they are
+        # only built when debug logging is enabled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                f"Worker resource status before allocating memory for job id {workflow.job_id}: - "
+                f"GPU: {self._resource_manager.get_available_gpu_memory():,} bytes, "
+                f"CPU: {self._resource_manager.get_available_cpu_memory():,} bytes"
+            )
+
+            logger.debug(
+                f"Allocating memory for job id {workflow.job_id}: - "
+                f"GPU: {workflow.gpu_memory_required:,} bytes, "
+                f"CPU: {workflow.cpu_memory_required:,} bytes"
+            )
 
         # TODO: Block until memory resource is available, instead of failing immediately
         if not self._resource_manager.allocate(
@@ -112,14 +116,15 @@ class WorkflowExecutor:
             )
             return
 
-        logger.debug(
-            f"Worker resource status after allocating memory for job id {workflow.job_id}: - "
-            f"GPU: {self._resource_manager.get_available_gpu_memory():,} bytes, "
-            f"CPU: {self._resource_manager.get_available_cpu_memory():,} bytes"
-        )
+        if debug_enabled:
+            logger.debug(
+                f"Worker resource status after allocating memory for job id {workflow.job_id}: - "
+                f"GPU: {self._resource_manager.get_available_gpu_memory():,} bytes, "
+                f"CPU: {self._resource_manager.get_available_cpu_memory():,} bytes"
+            )
 
         try:
-            logger.info(f"Starting execution of job {workflow.job_id}")
+            logger.info("Starting execution of job %s", workflow.job_id)
 
             success, index_path, msg = self._build_index_fn(workflow)
 
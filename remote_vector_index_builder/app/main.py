@@ -102,14 +102,17 @@ async def lifespan(app: FastAPI):
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    errors = []
-    for error in exc.errors():
-        field_path = get_field_path(error["loc"])
-        errors.append(
-            {"field": field_path, "message": error["msg"], "type": error["type"]}
-        )
-
-    logger.info(f"Error while validating parameters: #{errors}")
+    errors = [
+        {
+            "field": get_field_path(error["loc"]),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in exc.errors()
+    ]
+
+    # formatted only if the record is emitted
+    logger.info("Error while validating parameters: #%s", errors)
     return JSONResponse(
         status_code=422, content={"detail": "Validation Error", "errors": errors}
     )
@@ -4,7 +4,7 @@
 # The OpenSearch Contributors require contributions made to
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RequestParameters(BaseModel):
@@ -18,10 +18,15 @@ class RequestParameters(BaseModel):
     Attributes:
         vector_path (str): Path to the vector data file or resource
         tenant_id (str): Unique identifier for the tenant making the request
+
+    Note:
+        The class is configured to be immutable using the ConfigDict class, so the parameters
+        a job was created with cannot drift from those it is compared against.
     """
 
     vector_path: str
     tenant_id: str
+    model_config = ConfigDict(frozen=True)
 
     def __str__(self):
         """
@@ -5,7 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from core.common.models import IndexBuildParameters
 
 
@@ -22,9 +22,13 @@ class BuildWorkflow(BaseModel):
         cpu_memory_required (float): Amount of CPU memory required for the build process in bytes
         index_build_parameters (IndexBuildParameters): Parameters specifying how to build the index
 
+    Note:
+        The class is configured to be immutable using the ConfigDict class, since a workflow is
+        shared between the request thread and the executor thread that runs it.
     """
 
     job_id: str
     gpu_memory_required: float
     cpu_memory_required: float
     index_build_parameters: IndexBuildParameters
+    model_config = ConfigDict(frozen=True)
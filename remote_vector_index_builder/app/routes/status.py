@@ -33,12 +33,10 @@ def get_status(job_id: str, request: Request) -> GetStatusResponse:
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    response_data = {"task_status": job.status}
-
-    if hasattr(job, "file_name") and job.file_name is not None:
-        response_data["file_name"] = job.file_name
-
-    if hasattr(job, "error_message") and job.error_message is not None:
-        response_data["error_message"] = job.error_message
-
-    return GetStatusResponse(**response_data)
+    # The job fields were validated when the job was stored, so the response is built
+    # without validating them a second time
+    return GetStatusResponse.model_construct(
+        task_status=job.status,
+        file_name=job.file_name,
+        error_message=job.error_message,
+    )
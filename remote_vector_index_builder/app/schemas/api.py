@@ -5,7 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 from app.models.job import JobStatus
@@ -20,6 +20,7 @@ class CreateJobResponse(BaseModel):
     """
 
     job_id: str
+    model_config = ConfigDict(frozen=True)
 
 
 class GetStatusResponse(BaseModel):
@@ -35,3 +36,4 @@ class GetStatusResponse(BaseModel):
     task_status: JobStatus
     file_name: Optional[str] = None
     error_message: Optional[str] = None
+    model_config = ConfigDict(frozen=True)
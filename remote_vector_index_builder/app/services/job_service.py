@@ -183,7 +183,9 @@ class JobService:
 
         self._add_to_request_store(job_id, request_parameters)
         logger.debug(
-            f"Added job id: {job_id} with vector path {index_build_parameters.vector_path} to request store"
+            "Added job id: %s with vector path %s to request store",
+            job_id,
+            index_build_parameters.vector_path,
         )
 
         gpu_mem, cpu_mem = calculate_memory_requirements(index_build_parameters)
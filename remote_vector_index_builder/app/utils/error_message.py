@@ -4,9 +4,13 @@
 # The OpenSearch Contributors require contributions made to
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
+from functools import lru_cache
 from typing import Any
 
 
+# Requests with the same malformed shape produce the same locations; the cache is bounded
+# because the locations come from client input
+@lru_cache(maxsize=1024)
 def get_field_path(location: tuple[Any, ...]) -> str:
     """Convert a location tuple to a readable field path string.
     This function is used to format errors thrown by
@@ -6,9 +6,25 @@
 # compatible open source license.
 
 import faiss
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Tuple
 from dataclasses import dataclass
 
+# Per-parameter (predicate, error message) pairs, checked only for keys present in the params
+# Validation Ref: https://github.com/facebookresearch/faiss/blob/main/faiss/gpu/GpuIndexCagra.h#L67
+_PARAM_VALIDATORS: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    "n_lists": (lambda v: v > 0, "n_lists must be positive"),
+    "kmeans_n_iters": (lambda v: v > 0, "kmeans_n_iters must be positive"),
+    "kmeans_trainset_fraction": (
+        lambda v: 0 < v <= 1,
+        "kmeans_trainset_fraction must be between 0 and 1",
+    ),
+    "pq_bits": (
+        lambda v: v in (4, 5, 6, 7, 8),
+        "pq_bits must be one of [4, 5, 6, 7, 8]",
+    ),
+    "pq_dim": (lambda v: v >= 0, "pq_dim must be non-negative"),
+}
+
 
 @dataclass
 class IVFPQBuildCagraConfig:
@@ -66,37 +82,17 @@ class IVFPQBuildCagraConfig:
         Raises:
             ValueError: If any parameter fails validation
         """
-        if "n_lists" in params:
-            if params["n_lists"] <= 0:
-                raise ValueError(
-                    "IVFPQBuildCagraConfig param: n_lists must be positive"
-                )
-        if "kmeans_n_iters" in params:
-            if params["kmeans_n_iters"] <= 0:
-                raise ValueError(
-                    "IVFPQBuildCagraConfig param: kmeans_n_iters must be positive"
-                )
-        if "kmeans_trainset_fraction" in params:
-            if not 0 < params["kmeans_trainset_fraction"] <= 1:
-                raise ValueError(
-                    "IVFPQBuildCagraConfig param: kmeans_trainset_fraction must be between 0 and 1"
-                )
-        # Validation Ref: https://github.com/facebookresearch/faiss/blob/main/faiss/gpu/GpuIndexCagra.h#L67
-        if "pq_bits" in params:
-            if params["pq_bits"] not in [4, 5, 6, 7, 8]:
-                raise ValueError(
-                    "IVFPQBuildCagraConfig param: pq_bits must be one of [4, 5, 6, 7, 8]"
-                )
+        for name, value in params.items():
+            validator = _PARAM_VALIDATORS.get(name)
+            if validator is not None:
+                is_valid, message = validator
+                if not is_valid(value):
+                    raise ValueError(f"IVFPQBuildCagraConfig param: {message}")
+
+        # Check pq_dim constraints based on pq_bits
         if "pq_dim" in params:
-            pq_dim = params["pq_dim"]
-            if pq_dim < 0:
-                raise ValueError(
-                    "IVFPQBuildCagraConfig param: pq_dim must be non-negative"
-                )
-
-            # Check pq_dim constraints based on pq_bits
             pq_bits = params.get("pq_bits", 8)  # Use 8 if not specified
-            if pq_bits != 8 and pq_dim % 8 != 0:
+            if pq_bits != 8 and params["pq_dim"] % 8 != 0:
                 raise ValueError(
                     "IVFPQBuildCagraConfig param: When pq_bits is not 8, pq_dim must be a multiple of 8"
                 )
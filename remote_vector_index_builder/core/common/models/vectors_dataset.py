@@ -7,11 +7,22 @@
 
 from dataclasses import dataclass
 from io import BytesIO
+from typing import Union
 
 import numpy as np
 from core.common.exceptions import UnsupportedVectorsDataTypeError, VectorsDatasetError
 from core.common.models.index_build_parameters import DataType
 
+# Little-endian numpy dtype for each supported vector data type, constructed once so
+# np.frombuffer never has to parse a dtype string
+_NUMPY_DTYPES = {
+    DataType.FLOAT: np.dtype("<f4"),
+    DataType.FLOAT16: np.dtype("<f2"),
+    DataType.BYTE: np.dtype("<i1"),
+    DataType.BINARY: np.dtype("<u1"),
+}
+_DOC_ID_DTYPE = np.dtype("<i4")
+
 
 @dataclass
 class VectorsDataset:
@@ -31,40 +42,30 @@ class VectorsDataset:
     dtype: DataType
 
     def free_vectors_space(self):
-        """Free up memory by deleting the vectors and document IDs arrays."""
+        """Free up memory by deleting the vectors and document IDs arrays.
 
-        try:
-            del self.vectors
-        except AttributeError:
-            pass
-        try:
-            del self.doc_ids
-        except AttributeError:
-            pass
-        return
+        The arrays are dropped from the instance dict directly, so repeated calls are a no-op and
+        no garbage collection pass is forced; the buffers are released as soon as their refcount hits zero.
+        """
+        self.__dict__.pop("vectors", None)
+        self.__dict__.pop("doc_ids", None)
 
     @staticmethod
     def get_numpy_dtype(dtype: DataType):
-        """Convert DataType enum to numpy dtype string.
+        """Convert DataType enum to numpy dtype.
 
         Args:
             dtype (DataType): The data type enum value to convert.
 
         Returns:
-            str: The corresponding numpy dtype string.
+            numpy.dtype: The corresponding numpy dtype.
 
         Raises:
             UnsupportedVectorsDataTypeError: If the provided data type is not supported.
         """
-        if dtype == DataType.FLOAT:
-            return "<f4"
-        if dtype == DataType.FLOAT16:
-            return "<f2"
-        if dtype == DataType.BYTE:
-            return "<i1"
-        if dtype == DataType.BINARY:
-            return "<u1"
-        else:
+        try:
+            return _NUMPY_DTYPES[dtype]
+        except (KeyError, TypeError):
             raise UnsupportedVectorsDataTypeError(f"Unsupported data type: {dtype}")
 
     @staticmethod
@@ -83,10 +84,33 @@ class VectorsDataset:
                 f"Expected {expected_length} vectors, but got {len(vectors)}"
             )
 
+    @staticmethod
+    def _get_buffer(source: Union[BytesIO, bytes, bytearray, memoryview]):
+        """Return a buffer-protocol view over the source without copying its contents.
+
+        Args:
+            source: A BytesIO-like stream exposing getbuffer(), or any object supporting the buffer protocol.
+
+        Returns:
+            An object that np.frombuffer can consume directly.
+        """
+        if hasattr(source, "getbuffer"):
+            return source.getbuffer()
+        return source
+
+    @staticmethod
+    def _get_row_length(dimension: int, vector_dtype: DataType) -> int:
+        """Number of numpy elements that make up one vector.
+
+        For BINARY data type, dimension is the number of bits as one vector element will be quantized into a bit.
+        Therefore, to calculate the number of bytes needed, we need to divide it by 8
+        """
+        return int(dimension / 8 if vector_dtype == DataType.BINARY else dimension)
+
     @staticmethod
     def parse(
-        vectors,
-        doc_ids: BytesIO,
+        vectors: Union[BytesIO, bytes, bytearray, memoryview],
+        doc_ids: Union[BytesIO, bytes, bytearray, memoryview],
         dimension: int,
         doc_count: int,
         vector_dtype: DataType,
@@ -97,8 +121,8 @@ class VectorsDataset:
         dimensions, and creates a new VectorsDataset instance.
 
         Args:
-            vectors (BytesIO): Binary stream containing vector data.
-            doc_ids (BytesIO): Binary stream containing document IDs.
+            vectors: Binary stream or buffer-protocol object containing vector data.
+            doc_ids: Binary stream or buffer-protocol object containing document IDs.
             dimension (int): The dimensionality of each vector.
             doc_count (int): Expected number of vectors/documents.
             vector_dtype (DataType): The data type of the vector values.
@@ -111,23 +135,71 @@ class VectorsDataset:
         """
         try:
             # Create a view into the buffer, to prevent additional allocation of memory
-            vector_view = vectors.getbuffer()
+            vector_view = VectorsDataset._get_buffer(vectors)
             np_vectors = np.frombuffer(
                 vector_view, dtype=VectorsDataset.get_numpy_dtype(vector_dtype)
             )
-            # For BINARY data type, dimension is the number of bits as one vector element will be quantized into a bit.
-            # Therefore, to calculate the number of bytes needed, we need to divide it by 8
-            expected_length = int(
-                dimension / 8 if vector_dtype == DataType.BINARY else dimension
-            )
+            expected_length = VectorsDataset._get_row_length(dimension, vector_dtype)
             VectorsDataset.check_dimensions(np_vectors, doc_count * expected_length)
             np_vectors = np_vectors.reshape(doc_count, expected_length)
 
             # Do the same for doc ids
-            doc_id_view = doc_ids.getbuffer()
-            np_doc_ids = np.frombuffer(doc_id_view, dtype="<i4")
+            doc_id_view = VectorsDataset._get_buffer(doc_ids)
+            np_doc_ids = np.frombuffer(doc_id_view, dtype=_DOC_ID_DTYPE)
             VectorsDataset.check_dimensions(np_doc_ids, doc_count)
 
         except (ValueError, TypeError, MemoryError, RuntimeError) as e:
             raise VectorsDatasetError(f"Error parsing vectors: {e}") from e
         return VectorsDataset(np_vectors, np_doc_ids, vector_dtype)
+
+    @staticmethod
+    def _memmap_file(path: str, dtype: np.dtype) -> np.memmap:
+        """Read-only memory map of a whole file, mirroring the np.fromfile call shape."""
+        return np.memmap(path, dtype=dtype, mode="r")
+
+    @staticmethod
+    def parse_from_path(
+        vectors_path: str,
+        doc_ids_path: str,
+        dimension: int,
+        doc_count: int,
+        vector_dtype: DataType,
+        lazy: bool = True,
+    ):
+        """Load vector data and document IDs staged on local disk into numpy arrays.
+
+        By default the files are memory-mapped rather than read into process memory up
+        front; pages are faulted in lazily as the index builder consumes the arrays. With
+        lazy=False each file is read eagerly with a single np.fromfile call instead, which
+        avoids per-page faults when the arrays are consumed once, front to back.
+
+        Args:
+            vectors_path (str): Path to the file containing vector data.
+            doc_ids_path (str): Path to the file containing document IDs.
+            dimension (int): The dimensionality of each vector.
+            doc_count (int): Expected number of vectors/documents.
+            vector_dtype (DataType): The data type of the vector values.
+            lazy (bool): Memory-map the files instead of reading them. Defaults to True.
+
+        Returns:
+            VectorsDataset: A new instance backed by read-only memory maps of the files,
+                or by in-memory arrays when lazy is False.
+
+        Raises:
+            VectorsDatasetError: If the files cannot be read or fail validation.
+        """
+        load = VectorsDataset._memmap_file if lazy else np.fromfile
+        try:
+            flat_vectors = load(
+                vectors_path, dtype=VectorsDataset.get_numpy_dtype(vector_dtype)
+            )
+            expected_length = VectorsDataset._get_row_length(dimension, vector_dtype)
+            VectorsDataset.check_dimensions(flat_vectors, doc_count * expected_length)
+            np_vectors = flat_vectors.reshape(doc_count, expected_length)
+
+            np_doc_ids = load(doc_ids_path, dtype=_DOC_ID_DTYPE)
+            VectorsDataset.check_dimensions(np_doc_ids, doc_count)
+
+        except (OSError, ValueError, TypeError, MemoryError, RuntimeError) as e:
+            raise VectorsDatasetError(f"Error parsing vectors: {e}") from e
+        return VectorsDataset(np_vectors, np_doc_ids, vector_dtype)
@@ -105,10 +105,23 @@ class FP32ToFP16ConvertingBytesIO(BytesIO):
             # Clip bytes to have complete float values
             clip_start = 0 if head_byte_idx == 0 else 4 - head_byte_idx
             clip_end = len_bytes - tail_byte_idx
-            fp32_vector_values = np.frombuffer(b[clip_start:clip_end], dtype=np.float32)
-
-            # Convert FP32 values to FP16
-            self._fp16_np[copy_start_index:copy_end_index] = fp32_vector_values
+            # Skip the conversion when the write holds no complete float value
+            if copy_end_index > copy_start_index:
+                # View the complete float values in place rather than slicing `b`, which would copy the bytes
+                fp32_vector_values = np.frombuffer(
+                    b,
+                    dtype=np.float32,
+                    count=copy_end_index - copy_start_index,
+                    offset=clip_start,
+                )
+
+                # Convert FP32 values to FP16. The cast writes straight into the FP16 array and uses numpy's
+                # SIMD-dispatched (F16C / AVX-512) conversion loops where the CPU supports them.
+                np.copyto(
+                    self._fp16_np[copy_start_index:copy_end_index],
+                    fp32_vector_values,
+                    casting="same_kind",
+                )
 
             # Try to assemble incomplete float value from leading and trailing
             self._append_incomplete_bytes(
@@ -133,19 +146,18 @@ class FP32ToFP16ConvertingBytesIO(BytesIO):
 
         bytes_count = self._incomplete_vector_value.get(value_idx)
         if bytes_count is None:
-            bytes_count = {"count": 0, "bytes": [0] * 4}
+            bytes_count = {"count": 0, "bytes": bytearray(4)}
             self._incomplete_vector_value[value_idx] = bytes_count
-        four_bytes = bytes_count["bytes"]
 
-        offset = start_offset
-        while offset < end_offset:
-            four_bytes[byte_idx] = buffer[offset]
-            offset += 1
-            byte_idx += 1
+        # Copy the fragment into its position within the float value in one slice assignment
+        num_bytes = end_offset - start_offset
+        bytes_count["bytes"][byte_idx : byte_idx + num_bytes] = buffer[
+            start_offset:end_offset
+        ]
 
-        bytes_count["count"] += end_offset - start_offset
+        bytes_count["count"] += num_bytes
         if bytes_count["count"] == 4:
             self._fp16_np[value_idx] = np.frombuffer(
-                bytes(four_bytes), dtype=np.float32
+                bytes_count["bytes"], dtype=np.float32
             )[0]
             del self._incomplete_vector_value[value_idx]
@@ -15,15 +15,29 @@ from core.common.models import (
 )
 
 
+def get_available_cpu_count() -> int:
+    """
+    Count the CPUs this process may run on.
+    Prefers the scheduler affinity mask, which reflects container cpusets and taskset
+    restrictions, over os.cpu_count(), which reports every CPU on the host.
+
+    Returns:
+        int: Number of usable CPUs, at least 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
 def get_omp_num_threads():
     """
     Calculate the number of OpenMP threads to use for parallel processing.
-    Returns the maximum of (CPU count/4) or 1 to ensure at least one thread.
+    Returns the maximum of (available CPU count/4) or 1 to ensure at least one thread.
 
     Returns:
         int: Number of threads to use
     """
-    return max(math.floor(os.cpu_count() / 4), 1)
+    return max(math.floor(get_available_cpu_count() / 4), 1)
 
 
 def calculate_ivf_pq_n_lists(doc_count: int):
@@ -6,7 +6,8 @@
 # compatible open source license.
 
 from abc import ABC, abstractmethod
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence, Tuple, Union
 from io import BytesIO
 
 
@@ -22,13 +23,20 @@ class ObjectStore(ABC):
     """
 
     @abstractmethod
-    def read_blob(self, remote_store_path: str, bytes_buffer: BytesIO) -> None:
+    def read_blob(
+        self,
+        remote_store_path: str,
+        bytes_buffer: BytesIO,
+        size_hint: Optional[int] = None,
+    ) -> None:
         """
         Downloads the blob from the remote_store_path, to a buffer in memory
 
         Args:
             remote_store_path (str): The path/key to the remote object to be downloaded
             bytes_buffer (BytesIO): A bytes buffer where the downloaded data will be stored
+            size_hint (Optional[int]): Expected size of the blob in bytes, if known. Implementations
+                may use it to pick a cheaper download strategy for small blobs
 
         Returns:
             None
@@ -40,6 +48,46 @@ class ObjectStore(ABC):
         """
         pass
 
+    def read_blobs(
+        self,
+        items: Sequence[Tuple[str, BytesIO, Optional[int]]],
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Downloads several blobs concurrently, each to its own buffer in memory
+
+        The downloads share this object store instance, and with it any client and connection
+        pool the implementation holds, so per-blob request latency overlaps without
+        setting up a new connection per blob.
+
+        Args:
+            items (Sequence[Tuple[str, BytesIO, Optional[int]]]): (remote_store_path, bytes_buffer,
+                size_hint) for each blob, with the same meaning as the read_blob arguments
+            max_concurrency (Optional[int]): Maximum number of blobs downloaded at once.
+                Defaults to one per blob, up to 32
+
+        Returns:
+            None
+
+        Note:
+            - All downloads are waited on before returning; the first failure is then re-raised
+            - Caller is responsible for cleaning up each bytes buffer
+        """
+        if not items:
+            return
+        max_workers = min(max_concurrency or 32, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.read_blob, remote_store_path, bytes_buffer, size_hint=size_hint
+                )
+                for remote_store_path, bytes_buffer, size_hint in items
+            ]
+        # the executor has waited for every download on exit, so no download is left
+        # writing to its buffer when an error is raised here
+        for future in futures:
+            future.result()
+
     @abstractmethod
     def write_blob(self, data: Union[str, BytesIO], remote_store_path: str) -> None:
         """
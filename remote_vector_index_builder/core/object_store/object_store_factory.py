@@ -5,7 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, Type
 
 from core.common.exceptions import UnsupportedObjectStoreTypeError
 from core.common.models import IndexBuildParameters
@@ -24,6 +24,11 @@ class ObjectStoreFactory:
     coupling between different object store implementations.
     """
 
+    # Maps each supported repository type to its object store implementation
+    _registry: ClassVar[Dict[ObjectStoreType, Type[ObjectStore]]] = {
+        ObjectStoreType.S3: S3ObjectStore,
+    }
+
     @staticmethod
     def create_object_store(
         index_build_params: IndexBuildParameters, object_store_config: Dict[str, Any]
@@ -48,9 +53,12 @@ class ObjectStoreFactory:
             config = {"region": "us-west-2"}
             store = ObjectStoreFactory.create_object_store(params, config)
         """
-        if index_build_params.repository_type == ObjectStoreType.S3:
-            return S3ObjectStore(index_build_params, object_store_config)
-        else:
+        try:
+            object_store_cls = ObjectStoreFactory._registry[
+                index_build_params.repository_type
+            ]
+        except (KeyError, TypeError) as e:
             raise UnsupportedObjectStoreTypeError(
                 f"Unknown object store type: {index_build_params.repository_type}"
-            )
+            ) from e
+        return object_store_cls(index_build_params, object_store_config)
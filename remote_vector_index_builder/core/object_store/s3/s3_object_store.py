@@ -8,23 +8,29 @@
 import logging
 import math
 import os
+import shutil
 import sys
 import threading
-from functools import cache
-from typing import Any, Dict, Union
+from functools import cache, cached_property
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 from io import BytesIO
 
 import boto3
 from boto3.s3.transfer import TransferConfig
+from botocore.compat import HAS_CRT
 from botocore.config import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 from core.common.exceptions import BlobError
 from core.common.models import IndexBuildParameters
 from core.object_store.object_store import ObjectStore
 from core.object_store.s3.s3_object_store_config import S3ClientConfig
+from s3transfer.utils import S3_RETRYABLE_DOWNLOAD_ERRORS
 
 logger = logging.getLogger(__name__)
 
+# s3transfer reports progress every few KB; debug progress is only published in steps of this size
+PROGRESS_REPORT_INTERVAL_BYTES = 256 * 1024
+
 
 def get_cpus(factor: float) -> int:
     """Get the number of CPUs to use for s3 upload or download operation
@@ -56,7 +62,10 @@ def get_boto3_client(s3_client_config: S3ClientConfig) -> boto3.client:
     Returns:
         boto3.client: Configured S3 client instance
     """
-    config = Config(retries={"max_attempts": s3_client_config.max_retries})
+    config = Config(
+        retries={"max_attempts": s3_client_config.max_retries},
+        max_pool_connections=s3_client_config.max_pool_connections,
+    )
     return boto3.client(
         "s3",
         config=config,
@@ -82,7 +91,8 @@ class S3ObjectStore(ObjectStore):
         DEFAULT_DOWNLOAD_ARGS (dict): Default boto3 ALLOWED_DOWNLOAD_ARGS values.
             Includes encryption and checksum settings.
         DEFAULT_UPLOAD_ARGS (dict): Default boto3 ALLOWED_UPLOAD_ARGS values.
-            Includes encryption and checksum settings
+            Includes encryption and checksum settings. The checksum algorithm is CRC32C when
+            awscrt is installed, CRC32 otherwise; set upload_args["ChecksumAlgorithm"] to override
 
     Args:
         index_build_params (IndexBuildParameters): Parameters for the index building process
@@ -122,10 +132,12 @@ class S3ObjectStore(ObjectStore):
             https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
         """
 
+        # Downloads are network-bound, so use more ranged GETs than there are CPUs,
+        # capped at 32 concurrent requests
         self.DEFAULT_DOWNLOAD_TRANSFER_CONFIG = {
-            "multipart_chunksize": 50 * 1024 * 1024,  # 50MB
-            "max_concurrency": get_cpus(factor=0.625),
-            "multipart_threshold": 50 * 1024 * 1024,  # 50MB
+            "multipart_chunksize": 8 * 1024 * 1024,  # 8MB
+            "max_concurrency": min(32, get_cpus(factor=4)),
+            "multipart_threshold": 8 * 1024 * 1024,  # 8MB
             "io_chunksize": sys.maxsize,
         }
 
@@ -139,8 +151,10 @@ class S3ObjectStore(ObjectStore):
             "ChecksumMode": "ENABLED",
         }
 
+        # botocore only computes CRC32C through the optional awscrt package, where it is
+        # hardware accelerated; without it fall back to CRC32, computed by zlib
         self.DEFAULT_UPLOAD_ARGS = {
-            "ChecksumAlgorithm": "CRC32",
+            "ChecksumAlgorithm": "CRC32C" if HAS_CRT else "CRC32",
         }
         self.bucket = index_build_params.container_name
 
@@ -179,6 +193,10 @@ class S3ObjectStore(ObjectStore):
             upload_args, self.DEFAULT_UPLOAD_ARGS
         )
 
+        # Concurrent reads all check, and may set, the KMS key used for uploads
+        self._kms_key_lock = threading.Lock()
+        self._kms_key_checked_paths: Set[str] = set()
+
         self.debug = object_store_config.get("debug", False)
 
         # Debug mode provides progress tracking on downloads and uploads
@@ -188,6 +206,72 @@ class S3ObjectStore(ObjectStore):
             self._write_progress = 0
             self._write_progress_lock = threading.Lock()
 
+    def _make_progress_callback(
+        self,
+        progress_attr: str,
+        lock: threading.Lock,
+        action: str,
+        remote_store_path: str,
+    ) -> Tuple[Callable[[int], None], Callable[[], None]]:
+        """Create a boto3 progress callback that publishes aggregated progress.
+
+        Transferred bytes are accumulated locally and only added to the progress_attr
+        attribute, and logged, once at least PROGRESS_REPORT_INTERVAL_BYTES are pending.
+        The progress_attr attribute totals all transfers on this store; each callback also
+        keeps its own total, so concurrent transfers do not reset or mix their progress.
+
+        Args:
+            progress_attr (str): Name of the progress counter attribute to update
+            lock (threading.Lock): Lock guarding the progress counter
+            action (str): Verb used in the progress log line, e.g. "Downloaded"
+            remote_store_path (str): The S3 key being transferred, included in the log line
+
+        Returns:
+            Tuple[Callable[[int], None], Callable[[], None]]: The callback to pass as the boto3
+                'Callback' parameter, and a function that publishes any bytes still pending,
+                to be called once the transfer ends
+        """
+        pending = 0
+        transferred = 0
+
+        def publish(force: bool) -> None:
+            nonlocal pending, transferred
+            with lock:
+                if pending == 0 or (
+                    not force and pending < PROGRESS_REPORT_INTERVAL_BYTES
+                ):
+                    return
+                setattr(self, progress_attr, getattr(self, progress_attr) + pending)
+                transferred += pending
+                pending = 0
+                progress = transferred
+            logger.info(f"{action} {remote_store_path}: {progress:,} bytes")
+
+        def callback(bytes_transferred: int) -> None:
+            nonlocal pending
+            with lock:
+                pending += bytes_transferred
+            publish(force=False)
+
+        def flush() -> None:
+            publish(force=True)
+
+        return callback, flush
+
+    @cached_property
+    def _download_s3_transfer_config(self) -> TransferConfig:
+        """boto3 TransferConfig for downloads, built on first use and reused afterwards.
+
+        Built lazily rather than in __init__ so that unsupported parameters still surface
+        as a BlobError from read_blob.
+        """
+        return TransferConfig(**self.download_transfer_config)
+
+    @cached_property
+    def _upload_s3_transfer_config(self) -> TransferConfig:
+        """boto3 TransferConfig for uploads, built on first use and reused afterwards."""
+        return TransferConfig(**self.upload_transfer_config)
+
     @staticmethod
     def _create_custom_config(
         custom_config: Dict[str, Any], default_config: Dict[str, Any]
@@ -213,13 +297,19 @@ class S3ObjectStore(ObjectStore):
 
         return config_params
 
-    def read_blob(self, remote_store_path: str, bytes_buffer) -> None:
+    def read_blob(
+        self,
+        remote_store_path: str,
+        bytes_buffer,
+        size_hint: Optional[int] = None,
+    ) -> None:
         """
         Downloads a blob from S3 to the provided bytes buffer, with retry logic.
 
         Args:
             remote_store_path (str): The S3 key (path) of the object to download
             bytes_buffer: A bytes buffer to store the downloaded data
+            size_hint (Optional[int]): Expected size of the object in bytes, if known
 
         Returns:
             None
@@ -231,36 +321,43 @@ class S3ObjectStore(ObjectStore):
             - Uses configured TransferConfig for download parameters
                 - boto3 may perform the download in parallel multipart chunks,
                 based on the TransferConfig setting
+            - When size_hint is at most the multipart threshold, the object is fetched with a
+                single get_object call instead, skipping the transfer manager and its thread pool.
+                A head_object call still precedes it, unless a KMS key has already been found
 
         Raises:
             BlobError: If download fails after all retry attempts or encounters non-retryable error
         """
 
         callback_func = None
+        flush_progress = None
 
         # Set up progress callback, if debug mode is on
         if self.debug:
-            with self._read_progress_lock:
-                self._read_progress = 0
-
-            def callback(bytes_transferred):
-                with self._read_progress_lock:
-                    self._read_progress += bytes_transferred
-                    logger.info(f"Downloaded: {self._read_progress:,} bytes")
-
-            callback_func = callback
+            callback_func, flush_progress = self._make_progress_callback(
+                "_read_progress",
+                self._read_progress_lock,
+                "Downloaded",
+                remote_store_path,
+            )
 
         try:
             # Get KMS key for this object and save it to this class instance, to be used for object uploads later
             self.get_kms_key(remote_store_path)
 
-            # Create transfer config object
-            s3_transfer_config = TransferConfig(**self.download_transfer_config)
+            if (
+                size_hint is not None
+                and size_hint
+                <= self.download_transfer_config.get("multipart_threshold", 0)
+            ):
+                self._read_small_blob(remote_store_path, bytes_buffer, callback_func)
+                return
+
             self.s3_client.download_fileobj(
                 self.bucket,
                 remote_store_path,
                 bytes_buffer,
-                Config=s3_transfer_config,
+                Config=self._download_s3_transfer_config,
                 Callback=callback_func,
                 ExtraArgs=self.download_args,
             )
@@ -269,6 +366,67 @@ class S3ObjectStore(ObjectStore):
             raise BlobError(f"Error calling boto3.download_fileobj: {e}") from e
         except ClientError as e:
             raise BlobError(f"Error downloading file: {e}") from e
+        except BotoCoreError as e:
+            raise BlobError(f"Error downloading file: {e}") from e
+        finally:
+            # publish the bytes still held back below the report interval
+            if flush_progress is not None:
+                flush_progress()
+
+    def _read_small_blob(self, remote_store_path: str, bytes_buffer, callback_func):
+        """Download an object below the multipart threshold with a single GetObject request.
+
+        The botocore client retries the request itself, but not a failure while the body is
+        streamed. Like download_fileobj, such a failure is retried with a new GetObject, up to
+        max_retries times, after discarding the partially written body.
+        """
+        start_offset = bytes_buffer.tell()
+        for attempt in range(self.max_retries + 1):
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=remote_store_path, **self.download_args
+            )
+            try:
+                shutil.copyfileobj(response["Body"], bytes_buffer)
+                break
+            except S3_RETRYABLE_DOWNLOAD_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise BlobError(
+                        f"Error reading object {remote_store_path} after {attempt + 1} attempts: {e}"
+                    ) from e
+                logger.debug(
+                    "Retrying read of object %s after streaming error: %s",
+                    remote_store_path,
+                    e,
+                )
+                bytes_buffer.seek(start_offset)
+                bytes_buffer.truncate()
+
+        if callback_func is not None:
+            callback_func(response["ContentLength"])
+
+    def read_blobs(
+        self,
+        items: Sequence[Tuple[str, BytesIO, Optional[int]]],
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Downloads several blobs concurrently, see ObjectStore.read_blobs.
+
+        The KMS key of the first blob is looked up before the downloads start, so the key used for
+        later uploads does not depend on which download's head_object finishes first. Once a key
+        is found, the other downloads skip their head_object call.
+
+        Raises:
+            BlobError: If the KMS key lookup or any download fails
+        """
+        if items:
+            try:
+                self.get_kms_key(items[0][0])
+            except ClientError as e:
+                raise BlobError(f"Error downloading file: {e}") from e
+            except BotoCoreError as e:
+                raise BlobError(f"Error downloading file: {e}") from e
+        super().read_blobs(items, max_concurrency)
 
     def get_kms_key(self, remote_store_path: str) -> None:
         """
@@ -276,11 +434,20 @@ class S3ObjectStore(ObjectStore):
         this same KMS key will be used in future object uploads.
         """
 
-        # Only perform this check if the KMS key is not already saved
-        if not self.upload_args.get("SSEKMSKeyId"):
+        # The check and the update are done under one lock, so concurrent reads cannot
+        # overwrite a key that another read has already saved
+        with self._kms_key_lock:
+            # Only perform this check if the KMS key is not already saved, and this object
+            # has not been checked already
+            if (
+                self.upload_args.get("SSEKMSKeyId")
+                or remote_store_path in self._kms_key_checked_paths
+            ):
+                return
             head_obj_response = self.s3_client.head_object(
                 Bucket=self.bucket, Key=remote_store_path
             )
+            self._kms_key_checked_paths.add(remote_store_path)
 
             # If KMS key is found in object metadata, then configure SSE-KMS for future uploads
             if "SSEKMSKeyId" in head_obj_response:
@@ -311,29 +478,29 @@ class S3ObjectStore(ObjectStore):
         """
 
         callback_func = None
+        flush_progress = None
         if self.debug:
             # Set up progress callback, if debug mode is on
-            with self._write_progress_lock:
-                self._write_progress = 0
-
-            def callback(bytes_amount):
-                with self._write_progress_lock:
-                    self._write_progress += bytes_amount
-                    logger.info(f"Uploaded: {self._write_progress:,} bytes")
-
-            callback_func = callback
+            callback_func, flush_progress = self._make_progress_callback(
+                "_write_progress",
+                self._write_progress_lock,
+                "Uploaded",
+                remote_store_path,
+            )
 
         try:
-            # Create transfer config object
-            s3_transfer_config = TransferConfig(**self.upload_transfer_config)
             self._do_write_blob(
-                data, remote_store_path, s3_transfer_config, callback_func
+                data, remote_store_path, self._upload_s3_transfer_config, callback_func
             )
             return
         except TypeError as e:
             raise BlobError(f"Error calling boto3.upload_file: {e}") from e
         except ClientError as e:
             raise BlobError(f"Error uploading file: {e}") from e
+        finally:
+            # publish the bytes still held back below the report interval
+            if flush_progress is not None:
+                flush_progress()
 
     def _do_write_blob(
         self, data, remote_store_path, s3_transfer_config, callback_func
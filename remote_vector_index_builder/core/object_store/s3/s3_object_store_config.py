@@ -13,6 +13,9 @@ class S3ClientConfig(BaseModel):
         region_name (str) (required): AWS Region name
         endpoint_url (Optional[str]): Custom S3 endpoint URL
         max_retries (int) (default: 3): Maximum number of retry attempts for failed requests
+        max_pool_connections (int) (default: 64): Maximum number of pooled HTTP connections.
+            Must cover the combined max_concurrency of concurrent transfers, or botocore
+            discards and reopens connections
 
         AWS Credentials (all optional):
         aws_access_key_id (Optional[str]): AWS Access Key ID
@@ -28,6 +31,7 @@ class S3ClientConfig(BaseModel):
     region_name: str
     endpoint_url: Optional[str] = None
     max_retries: int = 3
+    max_pool_connections: int = 64
 
     # AWS Credentials parameters
     # Ref: https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
@@ -50,6 +54,7 @@ class S3ClientConfig(BaseModel):
             (
                 self.region_name,
                 self.max_retries,
+                self.max_pool_connections,
                 self.endpoint_url,
                 self.aws_access_key_id,
                 self.aws_secret_access_key,
@@ -80,6 +85,7 @@ class S3ClientConfig(BaseModel):
         return (
             self.region_name == other.region_name
             and self.max_retries == other.max_retries
+            and self.max_pool_connections == other.max_pool_connections
             and self.endpoint_url == other.endpoint_url
             and self.aws_access_key_id == other.aws_access_key_id
             and self.aws_secret_access_key == other.aws_secret_access_key
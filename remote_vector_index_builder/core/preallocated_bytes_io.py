@@ -0,0 +1,107 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+from io import BytesIO
+
+import numpy as np
+
+
+class BufferCapacityError(ValueError):
+    """Error raised when a write would extend a PreallocatedBytesIO past its capacity"""
+
+    pass
+
+
+class PreallocatedBytesIO(BytesIO):
+    """
+    A write target for object store downloads whose final size is known up front.
+
+    The bytes land directly in a NumPy array allocated once at full size, instead of in a BytesIO that grows
+    (and reallocates) as parts arrive. Parts may be written at any offset and in any order, as boto3 does for
+    ranged downloads. getbuffer() exposes only the bytes up to the furthest offset written, so a blob shorter
+    than the capacity is still caught by the dimension checks in VectorsDataset.parse.
+
+    Writes are expected to be serialized by the caller; boto3 performs all writes for one download from a
+    single I/O thread. The read side of the BytesIO interface (read, readinto, getvalue, truncate) works on the
+    same array, and close() drops the buffer's reference to it.
+    """
+
+    def __init__(self, capacity: int):
+        BytesIO.__init__(self)
+        # np.empty leaves the pages untouched until each part is written
+        self._array = np.empty(capacity, dtype=np.uint8)
+        self._curr_offset = 0
+        self._size = 0
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            self._curr_offset = offset
+        elif whence == os.SEEK_CUR:
+            self._curr_offset += offset
+        elif whence == os.SEEK_END:
+            self._curr_offset = self._size + offset
+        else:
+            raise ValueError(f"Unexpected whence={whence}")
+        return self._curr_offset
+
+    def tell(self):
+        return self._curr_offset
+
+    def write(self, b):
+        len_bytes = len(b)
+        end_offset = self._curr_offset + len_bytes
+        if end_offset > len(self._array):
+            raise BufferCapacityError(
+                f"Write of {len_bytes} bytes at offset {self._curr_offset} exceeds the buffer capacity "
+                f"of {len(self._array)} bytes"
+            )
+        self._array[self._curr_offset : end_offset] = np.frombuffer(b, dtype=np.uint8)
+        self._curr_offset = end_offset
+        self._size = max(self._size, end_offset)
+        return len_bytes
+
+    def getbuffer(self):
+        return memoryview(self._array[: self._size])
+
+    def getvalue(self):
+        return self._array[: self._size].tobytes()
+
+    def read(self, size=-1):
+        end_offset = self._size
+        if size is not None and size >= 0:
+            end_offset = min(end_offset, self._curr_offset + size)
+        data = self._array[self._curr_offset : end_offset].tobytes()
+        self._curr_offset += len(data)
+        return data
+
+    def readinto(self, b):
+        view = memoryview(b).cast("B")
+        len_bytes = max(0, min(len(view), self._size - self._curr_offset))
+        view[:len_bytes] = self._array[
+            self._curr_offset : self._curr_offset + len_bytes
+        ]
+        self._curr_offset += len_bytes
+        return len_bytes
+
+    def truncate(self, size=None):
+        if size is None:
+            size = self._curr_offset
+        if size < 0:
+            raise ValueError(f"Negative size value {size}")
+        self._size = min(self._size, size)
+        return size
+
+    def close(self):
+        # Views already handed out keep the array alive; the buffer itself no longer does
+        self._array = np.empty(0, dtype=np.uint8)
+        self._curr_offset = 0
+        self._size = 0
+        BytesIO.close(self)
@@ -40,9 +40,10 @@ from io import BytesIO
 from timeit import default_timer as timer
 import traceback
 from typing import Any, Dict, Optional, Union
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 
 
+from core.common.exceptions import VectorsDatasetError
 from core.common.models import (
     IndexBuildParameters,
     IndexSerializationMode,
@@ -50,6 +51,7 @@ from core.common.models import (
 )
 from core.index_builder.faiss.faiss_index_build_service import FaissIndexBuildService
 from core.object_store.object_store_factory import ObjectStoreFactory
+from core.preallocated_bytes_io import BufferCapacityError, PreallocatedBytesIO
 
 from remote_vector_index_builder.core.object_store.object_store import ObjectStore
 
@@ -116,8 +118,8 @@ def run_tasks(
         if object_store_config is None:
             object_store_config = {}
 
-        vector_buffer = BytesIO()
         doc_id_buffer = BytesIO()
+        vector_buffer: Optional[BytesIO] = None
         vectors_dataset = None
         try:
             logger.debug(
@@ -132,6 +134,7 @@ def run_tasks(
                 f"Downloading vector and doc id blobs for vector path: {index_build_params.vector_path}"
             )
             t1 = timer()
+            vector_buffer = _determine_streaming_buffer(index_build_params, None)
             vectors_dataset = create_vectors_dataset(
                 index_build_params=index_build_params,
                 object_store=object_store,
@@ -160,10 +163,12 @@ def run_tasks(
 
             # now that cpu index is in memory, free the vectors to optimize memory usage
 
-            # free the memory view to the vector and doc id buffer
+            # free the memory view to the vector and doc id buffer, and drop the dataset
+            # so the cleanup below does not release it a second time
             vectors_dataset.free_vectors_space()
+            vectors_dataset = None
 
-            # close the buffers
+            # close the vector and doc id buffers
             vector_buffer.close()
             doc_id_buffer.close()
 
@@ -208,7 +213,8 @@ def run_tasks(
         finally:
             if vectors_dataset is not None:
                 vectors_dataset.free_vectors_space()
-            vector_buffer.close()
+            if vector_buffer is not None:
+                vector_buffer.close()
             doc_id_buffer.close()
 
 
@@ -260,27 +266,41 @@ def build_index(
 
 
 def _determine_streaming_buffer(
-    index_build_params: IndexBuildParameters, vector_bytes_buffer
-):
+    index_build_params: IndexBuildParameters, vector_bytes_buffer: Optional[BytesIO]
+) -> BytesIO:
     from remote_vector_index_builder.core.common.models.index_build_parameters import (
         DataType,
     )
-    from remote_vector_index_builder.core.fp32_to_fp16_converting_bytes_io import (
+    from core.fp32_to_fp16_converting_bytes_io import (
         FP32ToFP16ConvertingBytesIO,
     )
 
     if index_build_params.data_type == DataType.FLOAT16:
+        # a buffer this function already made for the caller is reused, not replaced
+        if isinstance(vector_bytes_buffer, FP32ToFP16ConvertingBytesIO):
+            return vector_bytes_buffer
         return FP32ToFP16ConvertingBytesIO(
             index_build_params.doc_count * index_build_params.dimension
         )
 
-    return vector_bytes_buffer
+    if vector_bytes_buffer is not None:
+        return vector_bytes_buffer
+
+    # The blob size is known from the build parameters, so download into a buffer
+    # allocated once at full size rather than one that grows as parts arrive
+    if index_build_params.data_type == DataType.BINARY:
+        vector_size = index_build_params.dimension // 8
+    else:
+        vector_size = (
+            index_build_params.dimension * index_build_params.data_type.get_size()
+        )
+    return PreallocatedBytesIO(index_build_params.doc_count * vector_size)
 
 
 def create_vectors_dataset(
     index_build_params: IndexBuildParameters,
     object_store: ObjectStore,
-    vector_bytes_buffer: BytesIO,
+    vector_bytes_buffer: Optional[BytesIO],
     doc_id_bytes_buffer: BytesIO,
 ) -> VectorsDataset:
     """
@@ -289,7 +309,8 @@ def create_vectors_dataset(
     This function performs the first step in the index building process by:
     1. Creating an appropriate object store instance
     2. Downloading vector data from the specified vector_path, into the vector_bytes_buffer
-    3. Downloading document IDs from the specified doc_id_path, into the doc_id_bytes_buffer
+    3. Downloading document IDs from the specified doc_id_path, into the doc_id_bytes_buffer,
+        concurrently with step 2
     4. Combining them into a VectorsDataset object
 
     Args:
@@ -299,7 +320,8 @@ def create_vectors_dataset(
             - doc_id_path: Path to the document IDs in object storage
             - repository_type: Type of object store to use
         object_store (ObjectStore): Object store instance
-        vector_bytes_buffer: Buffer for storing vector binary data
+        vector_bytes_buffer: Buffer for storing vector binary data. If None, the vectors are
+            downloaded into a buffer preallocated from doc_count and dimension
         doc_id_bytes_buffer: Buffer for storing doc id binary data
 
     Returns:
@@ -326,8 +348,28 @@ def create_vectors_dataset(
     vector_bytes_buffer = _determine_streaming_buffer(
         index_build_params, vector_bytes_buffer
     )
-    object_store.read_blob(index_build_params.vector_path, vector_bytes_buffer)
-    object_store.read_blob(index_build_params.doc_id_path, doc_id_bytes_buffer)
+    # Download both blobs concurrently, so the request latency of the two overlaps.
+    # The vector blob is listed first, so that object stores which derive upload settings
+    # from the downloaded objects (such as the S3 KMS key) take them from the vectors
+    try:
+        object_store.read_blobs(
+            [
+                (index_build_params.vector_path, vector_bytes_buffer, None),
+                # Doc ids are little-endian int32, one per document
+                (
+                    index_build_params.doc_id_path,
+                    doc_id_bytes_buffer,
+                    index_build_params.doc_count * 4,
+                ),
+            ]
+        )
+    except BufferCapacityError as e:
+        # The preallocated buffer is sized from doc_count and dimension, so a blob that
+        # does not fit in it does not match the dataset described by the parameters
+        raise VectorsDatasetError(
+            f"Blob does not match the expected dataset size for vector path "
+            f"{index_build_params.vector_path}: {e}"
+        ) from e
 
     return VectorsDataset.parse(
         vector_bytes_buffer,
@@ -371,7 +413,7 @@ def upload_index(
     """
 
     # vector path has already been validated that it ends with '.knnvec' by pydantic regex
-    vector_root_path = ".".join(index_build_params.vector_path.split(".")[0:-1])
+    vector_root_path = index_build_params.vector_path.rpartition(".")[0]
 
     # the index path is in the same root location as the vector path
     index_remote_path = vector_root_path + "." + index_build_params.engine
@@ -405,5 +447,6 @@ def index_storage_context(
         try:
             yield index_local_path
         finally:
-            if os.path.exists(index_local_path):
-                os.remove(index_local_path)
+            # the index file is not written if the build fails before serialization
+            with suppress(FileNotFoundError):
+                os.unlink(index_local_path)
@@ -19,7 +19,9 @@ from remote_vector_index_builder.core.common.models.index_build_parameters impor
 )
 
 
-@pytest.fixture
+# Validated once per module, since most tests only read it; tests that need different
+# values should derive a copy with model_copy(update=...) instead of mutating it
+@pytest.fixture(scope="module")
 def index_build_parameters():
     """Create sample IndexBuildParameters for testing"""
     return IndexBuildParameters(
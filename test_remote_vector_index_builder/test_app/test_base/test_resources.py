@@ -107,3 +107,23 @@ def test_thread_safety(resource_manager):
     # Verify final memory state
     assert manager.get_available_gpu_memory() == total_gpu
     assert manager.get_available_cpu_memory() == total_cpu
+
+
+def test_concurrent_allocation_does_not_overcommit(resource_manager):
+    """Test that the check and the subtraction in allocate happen atomically"""
+    manager, total_gpu, total_cpu = resource_manager
+    num_threads = 10
+    results = []
+
+    def allocate_half():
+        results.append(manager.allocate(total_gpu / 2, total_cpu / 2))
+
+    threads = [Thread(target=allocate_half) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 2
+    assert manager.get_available_gpu_memory() == 0
+    assert manager.get_available_cpu_memory() == 0
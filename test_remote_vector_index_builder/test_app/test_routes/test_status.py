@@ -17,6 +17,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import Mock
 from app.routes import status
 from app.models.job import JobStatus, Job
+from app.models.request import RequestParameters
 
 
 @pytest.fixture
@@ -38,9 +39,15 @@ def mock_job_service():
 
 @pytest.fixture
 def mock_job():
-    job = Mock(spec=Job)
-    job.status = JobStatus.RUNNING
-    return job
+    # A real Job rather than Mock(spec=Job): pydantic fields with defaults are not class
+    # attributes, so a spec'd mock would not expose file_name and error_message
+    return Job(
+        id="test_job_123",
+        status=JobStatus.RUNNING,
+        request_parameters=RequestParameters(
+            vector_path="test.knnvec", tenant_id="tenant"
+        ),
+    )
 
 
 def test_get_status_basic(client, mock_job_service, mock_job):
@@ -51,3 +51,12 @@ def test_complex_path():
         get_field_path(("users", 0, "addresses", 1, "street"))
         == "users[0].addresses[1].street"
     )
+
+
+def test_repeated_location_is_cached():
+    """Test that a repeated location is served from the cache"""
+    location = ("index_parameters", "algorithm_parameters", "m")
+    get_field_path(location)
+    hits = get_field_path.cache_info().hits
+    assert get_field_path(location) == "index_parameters.algorithm_parameters.m"
+    assert get_field_path.cache_info().hits == hits + 1
@@ -5,8 +5,8 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-import faiss
 import pytest
+from unittest.mock import patch
 from typing import Dict, Any
 
 from core.common.models.index_builder.faiss import FaissIndexHNSWCagraBuilder
@@ -15,6 +15,8 @@ from core.common.models.index_builder import (
     FaissCpuBuildIndexOutput,
 )
 
+faiss = pytest.importorskip("faiss")
+
 
 class TestFaissIndexHNSWCagraBuilder:
 
@@ -37,6 +39,17 @@ class TestFaissIndexHNSWCagraBuilder:
         """Mock index ID map"""
         return faiss.IndexIDMap()
 
+    @pytest.fixture
+    def gpu_output_factory(self, mock_gpu_index, mock_index_id_map):
+        """Factory for GPU build outputs wrapping the mock index and ID map by default"""
+
+        def _make(**overrides):
+            fields = {"gpu_index": mock_gpu_index, "index_id_map": mock_index_id_map}
+            fields.update(overrides)
+            return FaissGpuBuildIndexOutput(**fields)
+
+        return _make
+
     def test_default_initialization(self, default_builder):
         assert default_builder.ef_search == 100
         assert default_builder.ef_construction == 100
@@ -56,12 +69,10 @@ class TestFaissIndexHNSWCagraBuilder:
         assert builder.base_level_only is True  # default value
 
     def test_convert_gpu_to_cpu_index_success(
-        self, default_builder, mock_gpu_index, mock_index_id_map
+        self, default_builder, gpu_output_factory
     ):
         """Test successful GPU to CPU index conversion"""
-        gpu_build_output = FaissGpuBuildIndexOutput(
-            gpu_index=mock_gpu_index, index_id_map=mock_index_id_map
-        )
+        gpu_build_output = gpu_output_factory()
 
         # Perform conversion
         result = default_builder.convert_gpu_to_cpu_index(gpu_build_output)
@@ -79,69 +90,55 @@ class TestFaissIndexHNSWCagraBuilder:
         assert gpu_build_output.index_id_map is None
 
     def test_convert_gpu_to_cpu_index_copy_error(
-        self, default_builder, mock_gpu_index, mock_index_id_map
+        self, default_builder, mock_gpu_index, gpu_output_factory
     ):
         def failing_copy(*args):
             raise RuntimeError("Simulated copy error")
 
-        mock_gpu_index.copyTo = failing_copy
-
-        with pytest.raises(Exception) as exc_info:
-            default_builder.convert_gpu_to_cpu_index(
-                FaissGpuBuildIndexOutput(
-                    gpu_index=mock_gpu_index, index_id_map=mock_index_id_map
-                )
-            )
+        # The index mocks use __slots__, so patch the method on the class instead of the instance
+        with patch.object(type(mock_gpu_index), "copyTo", failing_copy):
+            with pytest.raises(Exception) as exc_info:
+                default_builder.convert_gpu_to_cpu_index(gpu_output_factory())
         assert "Failed to convert GPU index to CPU index" in str(exc_info.value)
         assert "Simulated copy error" in str(exc_info.value)
 
     def test_skip_stored_vectors_passes_skip_storage(
-        self, mock_gpu_index, mock_index_id_map
+        self, mock_gpu_index, gpu_output_factory
     ):
         """Test that skip_stored_vectors=True passes skip_storage=True to copyTo"""
         builder = FaissIndexHNSWCagraBuilder(skip_stored_vectors=True)
 
         copy_calls = []
-        original_copyTo = mock_gpu_index.copyTo
+        original_copyTo = type(mock_gpu_index).copyTo
 
-        def tracking_copyTo(cpu_index, skip_storage=False):
+        def tracking_copyTo(index, cpu_index, skip_storage=False):
             copy_calls.append(skip_storage)
-            return original_copyTo(cpu_index, skip_storage)
+            return original_copyTo(index, cpu_index, skip_storage)
 
-        mock_gpu_index.copyTo = tracking_copyTo
-
-        builder.convert_gpu_to_cpu_index(
-            FaissGpuBuildIndexOutput(
-                gpu_index=mock_gpu_index, index_id_map=mock_index_id_map
-            )
-        )
+        with patch.object(type(mock_gpu_index), "copyTo", tracking_copyTo):
+            builder.convert_gpu_to_cpu_index(gpu_output_factory())
 
         assert len(copy_calls) == 1
         assert copy_calls[0] is True
 
     def test_skip_stored_vectors_false_passes_skip_storage_false(
-        self, default_builder, mock_gpu_index, mock_index_id_map
+        self, default_builder, mock_gpu_index, gpu_output_factory
     ):
         """Test that skip_stored_vectors=False (default) passes skip_storage=False to copyTo"""
         copy_calls = []
-        original_copyTo = mock_gpu_index.copyTo
+        original_copyTo = type(mock_gpu_index).copyTo
 
-        def tracking_copyTo(cpu_index, skip_storage=False):
+        def tracking_copyTo(index, cpu_index, skip_storage=False):
             copy_calls.append(skip_storage)
-            return original_copyTo(cpu_index, skip_storage)
-
-        mock_gpu_index.copyTo = tracking_copyTo
+            return original_copyTo(index, cpu_index, skip_storage)
 
-        default_builder.convert_gpu_to_cpu_index(
-            FaissGpuBuildIndexOutput(
-                gpu_index=mock_gpu_index, index_id_map=mock_index_id_map
-            )
-        )
+        with patch.object(type(mock_gpu_index), "copyTo", tracking_copyTo):
+            default_builder.convert_gpu_to_cpu_index(gpu_output_factory())
 
         assert len(copy_calls) == 1
         assert copy_calls[0] is False
 
-    def test_binary_skip_stored_vectors_passes_skip_storage(self):
+    def test_binary_skip_stored_vectors_passes_skip_storage(self, gpu_output_factory):
         """Test that skip_stored_vectors=True passes skip_storage=True to binary copyTo"""
         from core.common.models.index_build_parameters import DataType
 
@@ -153,24 +150,25 @@ class TestFaissIndexHNSWCagraBuilder:
         mock_binary_id_map = faiss.IndexBinaryIDMap()
 
         copy_calls = []
-        original_copyTo = mock_gpu_binary_index.copyTo
+        original_copyTo = type(mock_gpu_binary_index).copyTo
 
-        def tracking_copyTo(cpu_index, skip_storage=False):
+        def tracking_copyTo(index, cpu_index, skip_storage=False):
             copy_calls.append(skip_storage)
-            return original_copyTo(cpu_index, skip_storage)
-
-        mock_gpu_binary_index.copyTo = tracking_copyTo
+            return original_copyTo(index, cpu_index, skip_storage)
 
-        builder.convert_gpu_to_cpu_index(
-            FaissGpuBuildIndexOutput(
-                gpu_index=mock_gpu_binary_index, index_id_map=mock_binary_id_map
+        with patch.object(type(mock_gpu_binary_index), "copyTo", tracking_copyTo):
+            builder.convert_gpu_to_cpu_index(
+                gpu_output_factory(
+                    gpu_index=mock_gpu_binary_index, index_id_map=mock_binary_id_map
+                )
             )
-        )
 
         assert len(copy_calls) == 1
         assert copy_calls[0] is True
 
-    def test_binary_skip_stored_vectors_false_does_not_skip_storage(self):
+    def test_binary_skip_stored_vectors_false_does_not_skip_storage(
+        self, gpu_output_factory
+    ):
         """Test that skip_stored_vectors=False (default) does not skip storage for binary copyTo"""
         from core.common.models.index_build_parameters import DataType
 
@@ -180,19 +178,18 @@ class TestFaissIndexHNSWCagraBuilder:
         mock_binary_id_map = faiss.IndexBinaryIDMap()
 
         copy_calls = []
-        original_copyTo = mock_gpu_binary_index.copyTo
+        original_copyTo = type(mock_gpu_binary_index).copyTo
 
-        def tracking_copyTo(cpu_index, skip_storage=False):
+        def tracking_copyTo(index, cpu_index, skip_storage=False):
             copy_calls.append(skip_storage)
-            return original_copyTo(cpu_index, skip_storage)
-
-        mock_gpu_binary_index.copyTo = tracking_copyTo
+            return original_copyTo(index, cpu_index, skip_storage)
 
-        builder.convert_gpu_to_cpu_index(
-            FaissGpuBuildIndexOutput(
-                gpu_index=mock_gpu_binary_index, index_id_map=mock_binary_id_map
+        with patch.object(type(mock_gpu_binary_index), "copyTo", tracking_copyTo):
+            builder.convert_gpu_to_cpu_index(
+                gpu_output_factory(
+                    gpu_index=mock_gpu_binary_index, index_id_map=mock_binary_id_map
+                )
             )
-        )
 
         assert len(copy_calls) == 1
         assert copy_calls[0] is False
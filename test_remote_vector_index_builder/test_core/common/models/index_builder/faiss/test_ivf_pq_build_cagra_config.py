@@ -5,12 +5,28 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-import faiss
 import pytest
 from typing import Dict, Any
 import re
 from core.common.models.index_builder.faiss import IVFPQBuildCagraConfig
 
+faiss = pytest.importorskip("faiss")
+
+# Compiled once at import and shared across the parametrized invalid cases
+INVALID_PARAM_PATTERNS = {
+    name: re.compile(f"IVFPQBuildCagraConfig param: {re.escape(msg)}")
+    for name, msg in [
+        ("n_lists", "n_lists must be positive"),
+        ("kmeans_n_iters", "kmeans_n_iters must be positive"),
+        (
+            "kmeans_trainset_fraction",
+            "kmeans_trainset_fraction must be between 0 and 1",
+        ),
+        ("pq_bits", "pq_bits must be one of [4, 5, 6, 7, 8]"),
+        ("pq_dim", "pq_dim must be non-negative"),
+    ]
+}
+
 
 class TestIVFPQBuildCagraConfig:
 
@@ -56,32 +72,30 @@ class TestIVFPQBuildCagraConfig:
             IVFPQBuildCagraConfig._validate_params(params)
 
     @pytest.mark.parametrize(
-        "param,value,error_msg",
+        "param,value,error_pattern",
         [
-            ("n_lists", 0, "n_lists must be positive"),
-            ("n_lists", -1, "n_lists must be positive"),
-            ("kmeans_n_iters", 0, "kmeans_n_iters must be positive"),
-            ("kmeans_n_iters", -1, "kmeans_n_iters must be positive"),
+            ("n_lists", 0, INVALID_PARAM_PATTERNS["n_lists"]),
+            ("n_lists", -1, INVALID_PARAM_PATTERNS["n_lists"]),
+            ("kmeans_n_iters", 0, INVALID_PARAM_PATTERNS["kmeans_n_iters"]),
+            ("kmeans_n_iters", -1, INVALID_PARAM_PATTERNS["kmeans_n_iters"]),
             (
                 "kmeans_trainset_fraction",
                 0,
-                "kmeans_trainset_fraction must be between 0 and 1",
+                INVALID_PARAM_PATTERNS["kmeans_trainset_fraction"],
             ),
             (
                 "kmeans_trainset_fraction",
                 1.1,
-                "kmeans_trainset_fraction must be between 0 and 1",
+                INVALID_PARAM_PATTERNS["kmeans_trainset_fraction"],
             ),
-            ("pq_bits", 3, re.escape("pq_bits must be one of [4, 5, 6, 7, 8]")),
-            ("pq_bits", 9, re.escape("pq_bits must be one of [4, 5, 6, 7, 8]")),
-            ("pq_dim", -1, "pq_dim must be non-negative"),
+            ("pq_bits", 3, INVALID_PARAM_PATTERNS["pq_bits"]),
+            ("pq_bits", 9, INVALID_PARAM_PATTERNS["pq_bits"]),
+            ("pq_dim", -1, INVALID_PARAM_PATTERNS["pq_dim"]),
         ],
     )
-    def test_validate_params_invalid(self, param, value, error_msg):
+    def test_validate_params_invalid(self, param, value, error_pattern):
         params = {param: value}
-        with pytest.raises(
-            ValueError, match=f"IVFPQBuildCagraConfig param: {error_msg}"
-        ):
+        with pytest.raises(ValueError, match=error_pattern):
             IVFPQBuildCagraConfig._validate_params(params)
 
     def test_to_faiss_config(self, custom_params):
@@ -5,12 +5,19 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-import faiss
+import re
+
 import pytest
 from typing import Dict, Any
 
 from core.common.models.index_builder.faiss import IVFPQSearchCagraConfig
 
+faiss = pytest.importorskip("faiss")
+
+N_PROBES_INVALID_PATTERN = re.compile(
+    "IVFPQSearchCagraConfig param: n_probes must be positive"
+)
+
 
 class TestIVFPQSearchCagraConfig:
 
@@ -43,10 +50,7 @@ class TestIVFPQSearchCagraConfig:
         params = {"n_probes": n_probes}
 
         if error_expected:
-            with pytest.raises(
-                ValueError,
-                match="IVFPQSearchCagraConfig param: n_probes must be positive",
-            ):
+            with pytest.raises(ValueError, match=N_PROBES_INVALID_PATTERN):
                 IVFPQSearchCagraConfig.from_dict(params)
         else:
             config = IVFPQSearchCagraConfig.from_dict(params)
@@ -4,6 +4,7 @@
 # The OpenSearch Contributors require contributions made to
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
+import struct
 from io import BytesIO
 from unittest.mock import patch
 
@@ -11,7 +12,19 @@ import numpy as np
 import pytest
 from core.common.exceptions import UnsupportedVectorsDataTypeError, VectorsDatasetError
 from core.common.models.index_build_parameters import DataType
-from core.common.models.vectors_dataset import VectorsDataset
+from core.common.models.vectors_dataset import _NUMPY_DTYPES, VectorsDataset
+
+F4 = np.dtype("<f4")
+F2 = np.dtype("<f2")
+I1 = np.dtype("<i1")
+U1 = np.dtype("<u1")
+
+
+def assert_same_buffer(actual, expected):
+    """Compare small arrays by dtype, shape and raw bytes instead of element-wise."""
+    assert actual.dtype == expected.dtype
+    assert actual.shape == expected.shape
+    assert actual.tobytes() == expected.tobytes()
 
 
 def test_initialization(sample_vectors, sample_doc_ids):
@@ -43,13 +56,21 @@ def test_free_vectors_space_when_vectors_and_doc_ids_already_deleted(vectors_dat
 @pytest.mark.parametrize(
     "dtype, expected",
     [
-        (DataType.FLOAT, "<f4"),
-        (DataType.BYTE, "<i1"),
-        (DataType.BINARY, "<u1"),
+        (DataType.FLOAT, F4),
+        (DataType.FLOAT16, F2),
+        (DataType.BYTE, I1),
+        (DataType.BINARY, U1),
     ],
 )
 def test_get_numpy_dtype_valid(dtype, expected):
-    assert VectorsDataset.get_numpy_dtype(dtype) == expected
+    result = VectorsDataset.get_numpy_dtype(dtype)
+    assert result == expected
+    # the pre-constructed dtype object is returned, not a fresh np.dtype per call
+    assert result is _NUMPY_DTYPES[dtype]
+
+
+def test_get_numpy_dtype_covers_all_data_types():
+    assert set(_NUMPY_DTYPES) == set(DataType)
 
 
 def test_get_numpy_dtype_invalid():
@@ -68,19 +89,28 @@ def test_check_dimensions_invalid():
         VectorsDataset.check_dimensions(vectors, 10)
 
 
-def test_parse_valid_fp32_data(sample_vectors, sample_doc_ids):
-    _do_test_parse_valid_data(sample_vectors, sample_doc_ids, DataType.FLOAT)
-
-
-def test_parse_valid_byte_data(sample_byte_vectors, sample_doc_ids):
-    _do_test_parse_valid_data(sample_byte_vectors, sample_doc_ids, DataType.BYTE)
-
-
-def test_parse_valid_binary_data(sample_binary_vectors, sample_doc_ids):
-    _do_test_parse_valid_data(sample_binary_vectors, sample_doc_ids, DataType.BINARY)
-
+@pytest.mark.parametrize(
+    "vectors_fixture, vector_dtype",
+    [
+        ("sample_vectors", DataType.FLOAT),
+        ("sample_byte_vectors", DataType.BYTE),
+        ("sample_binary_vectors", DataType.BINARY),
+    ],
+)
+@pytest.mark.parametrize("source", ["bytesio", "memoryview"])
+def test_parse_valid_data(
+    request, vectors_fixture, vector_dtype, source, sample_doc_ids
+):
+    sample_vectors = request.getfixturevalue(vectors_fixture)
+    if source == "bytesio":
+        # Stream path: wrap the pre-serialized fixture bytes
+        vectors_source = BytesIO(request.getfixturevalue(f"{vectors_fixture}_bytes"))
+        doc_ids_source = BytesIO(request.getfixturevalue("sample_doc_ids_bytes"))
+    else:
+        # Buffer path: byte views straight over the fixture arrays' storage
+        vectors_source = request.getfixturevalue(f"{vectors_fixture}_buffer")
+        doc_ids_source = request.getfixturevalue("sample_doc_ids_buffer")
 
-def _do_test_parse_valid_data(sample_vectors, sample_doc_ids, vector_dtype):
     # Prepare test data
     dimension = len(sample_vectors[0])
     if vector_dtype == DataType.BINARY:
@@ -88,14 +118,10 @@ def _do_test_parse_valid_data(sample_vectors, sample_doc_ids, vector_dtype):
         dimension = dimension * 8
     doc_count = len(sample_vectors)
 
-    # Convert to binary
-    vectors_binary = BytesIO(sample_vectors.tobytes())
-    doc_ids_binary = BytesIO(sample_doc_ids.tobytes())
-
     # Parse
     dataset = VectorsDataset.parse(
-        vectors=vectors_binary,
-        doc_ids=doc_ids_binary,
+        vectors=vectors_source,
+        doc_ids=doc_ids_source,
         dimension=dimension,
         doc_count=doc_count,
         vector_dtype=vector_dtype,
@@ -110,105 +136,204 @@ def _do_test_parse_valid_data(sample_vectors, sample_doc_ids, vector_dtype):
     assert dataset.vectors.shape == (doc_count, last_shape)
     assert len(dataset.doc_ids) == doc_count
     assert len(dataset.vectors) == doc_count
-    assert np.array_equal(dataset.doc_ids, sample_doc_ids)
-    assert np.array_equal(dataset.vectors, sample_vectors)
+    assert_same_buffer(dataset.doc_ids, sample_doc_ids)
+    assert_same_buffer(dataset.vectors, sample_vectors)
     assert dataset.dtype == vector_dtype
+    # parse promises views over the input buffers, not copies
+    assert dataset.vectors.flags.owndata is False
+    assert dataset.doc_ids.flags.owndata is False
 
     dataset.free_vectors_space()
-    vectors_binary.close()
-    doc_ids_binary.close()
+    if source == "bytesio":
+        vectors_source.close()
+        doc_ids_source.close()
+
+
+FIVE_DOC_IDS_BYTES = struct.pack("<5i", 1, 2, 3, 4, 5)
+SIX_DOC_IDS_BYTES = struct.pack("<6i", 1, 2, 3, 4, 5, 6)
+
+# (vectors bytes, doc ids bytes, dimension, doc_count, vector dtype) as static byte literals
+INVALID_PARSE_CASES = [
+    pytest.param(
+        b"\x00" * 32,
+        SIX_DOC_IDS_BYTES,
+        1,
+        8,
+        DataType.FLOAT,
+        id="doc_count_float",
+    ),
+    pytest.param(
+        b"\x00" * 8,
+        SIX_DOC_IDS_BYTES,
+        1,
+        8,
+        DataType.BYTE,
+        id="doc_count_byte",
+    ),
+    # In binary vector, one bit represents one vector so one byte represents 8 vectors each.
+    pytest.param(
+        b"\x00",
+        SIX_DOC_IDS_BYTES,
+        1,
+        1,
+        DataType.BINARY,
+        id="doc_count_binary",
+    ),
+    # Expecting 10 values (5*2), but only provided 5
+    pytest.param(
+        b"\x00" * 20,
+        FIVE_DOC_IDS_BYTES,
+        2,
+        5,
+        DataType.FLOAT,
+        id="vector_dimensions_float",
+    ),
+    pytest.param(
+        b"\x00" * 5,
+        FIVE_DOC_IDS_BYTES,
+        2,
+        5,
+        DataType.BYTE,
+        id="vector_dimensions_byte",
+    ),
+    # e.g. one vector element would occupy 1 byte (= 8 bits)
+    pytest.param(
+        b"\x00" * 10,
+        FIVE_DOC_IDS_BYTES,
+        8,
+        10,
+        DataType.BINARY,
+        id="binary_vector_dimensions_10_docs",
+    ),
+    pytest.param(
+        b"\x00" * 3,
+        FIVE_DOC_IDS_BYTES,
+        8,
+        3,
+        DataType.BINARY,
+        id="binary_vector_dimensions_3_docs",
+    ),
+]
 
 
 @pytest.mark.parametrize(
-    "vector_dtype, numpy_dtype",
-    [
-        (DataType.FLOAT, "<f4"),
-        (DataType.BYTE, "<i1"),
-        (DataType.BINARY, "<u1"),
-    ],
+    "vectors_bytes, doc_ids_bytes, dimension, doc_count, vector_dtype",
+    INVALID_PARSE_CASES,
 )
-def _do_test_parse_invalid_doc_count(vector_dtype, numpy_dtype):
+def test_parse_invalid(
+    vectors_bytes, doc_ids_bytes, dimension, doc_count, vector_dtype
+):
     with pytest.raises(VectorsDatasetError):
-        num_vectors = 8
-        if vector_dtype == DataType.BINARY:
-            # In binary vector, one bit represents one vector so one byte represents 8 vectors each.
-            num_vectors = 1
-
-        vectors = BytesIO(np.zeros(num_vectors, dtype=numpy_dtype).tobytes())
-        doc_ids = BytesIO(np.array([1, 2, 3, 4, 5, 6], dtype="<i4").tobytes())
-        dataset = VectorsDataset.parse(
-            vectors=vectors,
-            doc_ids=doc_ids,
-            dimension=1,
-            doc_count=num_vectors,
+        VectorsDataset.parse(
+            vectors=BytesIO(vectors_bytes),
+            doc_ids=BytesIO(doc_ids_bytes),
+            dimension=dimension,
+            doc_count=doc_count,
             vector_dtype=vector_dtype,
         )
-        dataset.free_vectors_space()
-        vectors.close()
-        doc_ids.close()
 
 
 @pytest.mark.parametrize(
-    "vector_dtype, numpy_dtype",
+    "vector_dtype, vectors_bytes",
     [
-        (DataType.FLOAT, "<f4"),
-        (DataType.BYTE, "<i1"),
+        (DataType.FLOAT, b"\x00" * 24),
+        (DataType.BYTE, b"\x00" * 6),
+        (DataType.BINARY, b"\x00" * 6),
     ],
 )
-def test_parse_invalid_vector_dimensions(vector_dtype, numpy_dtype):
-    with pytest.raises(VectorsDatasetError):
-        vectors = BytesIO(np.zeros(5, dtype=numpy_dtype).tobytes())
-        doc_ids = BytesIO(np.array([1, 2, 3, 4, 5], dtype="<i4").tobytes())
-        dataset = VectorsDataset.parse(
-            vectors=vectors,
-            doc_ids=doc_ids,
-            dimension=2,  # Expecting 10 values (5*2), but only provided 5
+def test_parse_invalid_data(vector_dtype, vectors_bytes):
+    with patch("numpy.frombuffer") as mock_frombuffer:
+        mock_frombuffer.side_effect = ValueError("Invalid data")
+        with pytest.raises(VectorsDatasetError):
+            VectorsDataset.parse(
+                vectors=BytesIO(vectors_bytes),
+                doc_ids=BytesIO(SIX_DOC_IDS_BYTES),
+                dimension=1,
+                doc_count=6,
+                vector_dtype=vector_dtype,
+            )
+
+
+@pytest.mark.parametrize(
+    "vectors_fixture, vector_dtype",
+    [
+        ("sample_vectors", DataType.FLOAT),
+        ("sample_byte_vectors", DataType.BYTE),
+        ("sample_binary_vectors", DataType.BINARY),
+    ],
+)
+def test_parse_from_path(
+    request, tmp_path, vectors_fixture, vector_dtype, sample_doc_ids
+):
+    sample_vectors = request.getfixturevalue(vectors_fixture)
+    vectors_path = tmp_path / "vectors.knnvec"
+    doc_ids_path = tmp_path / "doc_ids.knndid"
+    vectors_path.write_bytes(request.getfixturevalue(f"{vectors_fixture}_bytes"))
+    doc_ids_path.write_bytes(request.getfixturevalue("sample_doc_ids_bytes"))
+
+    dimension = len(sample_vectors[0])
+    if vector_dtype == DataType.BINARY:
+        dimension = dimension * 8
+
+    dataset = VectorsDataset.parse_from_path(
+        vectors_path=str(vectors_path),
+        doc_ids_path=str(doc_ids_path),
+        dimension=dimension,
+        doc_count=len(sample_vectors),
+        vector_dtype=vector_dtype,
+    )
+
+    assert isinstance(dataset.vectors, np.memmap)
+    assert_same_buffer(np.asarray(dataset.vectors), sample_vectors)
+    assert_same_buffer(np.asarray(dataset.doc_ids), sample_doc_ids)
+    assert dataset.dtype == vector_dtype
+    dataset.free_vectors_space()
+
+
+def test_parse_from_path_eager(tmp_path, sample_vectors, sample_doc_ids):
+    vectors_path = tmp_path / "vectors.knnvec"
+    doc_ids_path = tmp_path / "doc_ids.knndid"
+    vectors_path.write_bytes(sample_vectors.tobytes())
+    doc_ids_path.write_bytes(sample_doc_ids.tobytes())
+
+    with patch("numpy.memmap") as mock_memmap:
+        dataset = VectorsDataset.parse_from_path(
+            vectors_path=str(vectors_path),
+            doc_ids_path=str(doc_ids_path),
+            dimension=3,
             doc_count=5,
-            vector_dtype=vector_dtype,
+            vector_dtype=DataType.FLOAT,
+            lazy=False,
         )
-        dataset.free_vectors_space()
-        vectors.close()
-        doc_ids.close()
+    mock_memmap.assert_not_called()
+
+    assert not isinstance(dataset.vectors, np.memmap)
+    assert_same_buffer(dataset.vectors, sample_vectors)
+    assert_same_buffer(dataset.doc_ids, sample_doc_ids)
+
 
+def test_parse_from_path_invalid_dimensions(tmp_path):
+    vectors_path = tmp_path / "vectors.knnvec"
+    doc_ids_path = tmp_path / "doc_ids.knndid"
+    vectors_path.write_bytes(b"\x00" * 20)
+    doc_ids_path.write_bytes(FIVE_DOC_IDS_BYTES)
 
-@pytest.mark.parametrize("num_docs", [10, 3])
-def test_parse_invalid_binary_vector_dimensions(num_docs):
     with pytest.raises(VectorsDatasetError):
-        vectors = BytesIO(np.zeros(num_docs, dtype="<u1").tobytes())
-        doc_ids = BytesIO(np.array([1, 2, 3, 4, 5], dtype="<i4").tobytes())
-        dataset = VectorsDataset.parse(
-            vectors=vectors,
-            doc_ids=doc_ids,
-            dimension=8,  # e.g. one vector element would occupy 1 byte (= 8 bits)
-            doc_count=num_docs,
-            vector_dtype=DataType.BINARY,
+        VectorsDataset.parse_from_path(
+            vectors_path=str(vectors_path),
+            doc_ids_path=str(doc_ids_path),
+            dimension=2,  # Expecting 10 values (5*2), but only provided 5
+            doc_count=5,
+            vector_dtype=DataType.FLOAT,
         )
-        dataset.free_vectors_space()
-        vectors.close()
-        doc_ids.close()
 
 
-@pytest.mark.parametrize(
-    "vector_dtype, numpy_dtype",
-    [
-        (DataType.FLOAT, "<f4"),
-        (DataType.BYTE, "<i1"),
-        (DataType.BINARY, "<u1"),
-    ],
-)
-def test_parse_invalid_data(vector_dtype, numpy_dtype):
-    with patch("numpy.frombuffer") as mock_frombuffer:
-        mock_frombuffer.side_effect = ValueError("Invalid data")
-        with pytest.raises(VectorsDatasetError):
-            vectors = BytesIO(np.zeros(6, dtype=numpy_dtype).tobytes())
-            doc_ids = BytesIO(np.array([1, 2, 3, 4, 5, 6], dtype="<i4").tobytes())
-            dataset = VectorsDataset.parse(
-                vectors=vectors,
-                doc_ids=doc_ids,
-                dimension=1,
-                doc_count=6,
-                vector_dtype=vector_dtype,
-            )
-            dataset.free_vectors_space()
-            vectors.close()
-            doc_ids.close()
+def test_parse_from_path_missing_file(tmp_path):
+    with pytest.raises(VectorsDatasetError):
+        VectorsDataset.parse_from_path(
+            vectors_path=str(tmp_path / "missing.knnvec"),
+            doc_ids_path=str(tmp_path / "missing.knndid"),
+            dimension=3,
+            doc_count=5,
+            vector_dtype=DataType.FLOAT,
+        )
@@ -5,16 +5,24 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import itertools
 import numpy as np
+import os
 import pytest
+import struct
 import sys
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
+from typing import List, Optional
 from unittest.mock import Mock
 
 from core.common.models import VectorsDataset
 from core.common.models.index_build_parameters import DataType
 from core.object_store.s3.s3_object_store_config import S3ClientConfig
 
+# Set SKIP_FAISS=1 to skip collecting the faiss builder model tests when iterating on other modules
+if os.environ.get("SKIP_FAISS") == "1":
+    collect_ignore_glob = ["common/models/index_builder/faiss/*"]
+
 
 class MockPyCallbackIOWriter:
     """Mock for faiss.PyCallbackIOWriter"""
@@ -23,20 +31,39 @@ class MockPyCallbackIOWriter:
         self.callback = callback
 
 
+# Set MOCK_DEBUG=1 to log mock index destruction
+_DEBUG = os.environ.get("MOCK_DEBUG") == "1"
+
+# Set FAISS_MOCK_NULL_SINK=1 to record the paths given to the mocked index writers instead of writing files
+_NULL_SINK = os.environ.get("FAISS_MOCK_NULL_SINK") == "1"
+_written_index_paths: List[str] = []
+
+# Monotonic ids for the tracked mocks; unlike id(self), an id is never reused once its object dies
+_mock_ids = itertools.count()
+
+
 class DeletionTracker:
-    """Helper class to track object deletions"""
+    """Helper class to track object deletions in a bitmap indexed by mock id"""
+
+    __slots__ = ("bitmap",)
 
     def __init__(self):
-        self.deleted_objects = set()
+        self.bitmap = bytearray(16)
 
     def mark_deleted(self, obj_id):
-        self.deleted_objects.add(obj_id)
+        byte = obj_id >> 3
+        if byte >= len(self.bitmap):
+            self.bitmap.extend(
+                bytes(max(byte + 1, 2 * len(self.bitmap)) - len(self.bitmap))
+            )
+        self.bitmap[byte] |= 1 << (obj_id & 7)
 
     def is_deleted(self, obj_id):
-        return obj_id in self.deleted_objects
+        byte = obj_id >> 3
+        return byte < len(self.bitmap) and bool(self.bitmap[byte] & (1 << (obj_id & 7)))
 
     def reset(self):
-        self.deleted_objects.clear()
+        self.bitmap[:] = bytes(len(self.bitmap))
 
 
 # Create global deletion tracker
@@ -50,24 +77,20 @@ def deletion_tracker():
     return _deletion_tracker
 
 
-@pytest.fixture(autouse=True)
-def reset_deletion_tracker():
-    """Reset deletion tracker before each test"""
-    _deletion_tracker.reset()
-    yield
-
-
 class MockGpuIndexCagra:
     """Mock for faiss.GpuIndexCagra with deletion tracking"""
 
+    __slots__ = ("id", "thisown", "args", "kwargs")
+
     def __init__(self, *args, **kwargs):
-        self.id = id(self)
+        self.id = next(_mock_ids)
         self.thisown = False
         self.args = args
         self.kwargs = kwargs
 
     def __del__(self):
-        print("deleting MockGpuIndexCagra:", self.id)
+        if _DEBUG:
+            print("deleting MockGpuIndexCagra:", self.id)
         _deletion_tracker.mark_deleted(self.id)
 
     @property
@@ -85,14 +108,17 @@ class MockGpuIndexCagra:
 class MockGpuIndexBinaryCagra:
     """Mock for faiss.GpuIndexBinaryCagra with deletion tracking"""
 
+    __slots__ = ("id", "thisown", "args", "kwargs")
+
     def __init__(self, *args, **kwargs):
-        self.id = id(self)
+        self.id = next(_mock_ids)
         self.thisown = False
         self.args = args
         self.kwargs = kwargs
 
     def __del__(self):
-        print("deleting MockGpuIndexBinaryCagra:", self.id)
+        if _DEBUG:
+            print("deleting MockGpuIndexBinaryCagra:", self.id)
         _deletion_tracker.mark_deleted(self.id)
 
     @property
@@ -110,15 +136,18 @@ class MockGpuIndexBinaryCagra:
 class MockIndexIDMap:
     """Mock for faiss.IndexIDMap with deletion tracking"""
 
+    __slots__ = ("id", "own_fields", "index", "thisown", "args", "kwargs")
+
     def __init__(self, *args, **kwargs):
-        self.id = id(self)
+        self.id = next(_mock_ids)
         self.own_fields = False
         self.index = None
         self.args = args
         self.kwargs = kwargs
 
     def __del__(self):
-        print("deleting MockIndexIDMap:", self.id)
+        if _DEBUG:
+            print("deleting MockIndexIDMap:", self.id)
         _deletion_tracker.mark_deleted(self.id)
 
     @property
@@ -132,15 +161,18 @@ class MockIndexIDMap:
 class MockIndexBinaryIDMap:
     """Mock for faiss.IndexBinaryIDMap with deletion tracking"""
 
+    __slots__ = ("id", "own_fields", "index", "thisown", "args", "kwargs")
+
     def __init__(self, *args, **kwargs):
-        self.id = id(self)
+        self.id = next(_mock_ids)
         self.own_fields = False
         self.index = None
         self.args = args
         self.kwargs = kwargs
 
     def __del__(self):
-        print("deleting IndexBinaryIDMap:", self.id)
+        if _DEBUG:
+            print("deleting IndexBinaryIDMap:", self.id)
         _deletion_tracker.mark_deleted(self.id)
 
     @property
@@ -151,12 +183,12 @@ class MockIndexBinaryIDMap:
         pass
 
 
-class MockIndexHNSWCagra(Mock):
+class MockIndexHNSWCagra:
     """Mock for faiss.IndexHNSWCagra"""
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.hnsw = Mock()
+        self.id = next(_mock_ids)
+        self.hnsw = SimpleNamespace()
         self.base_level_only = True
 
     def __del__(self):
@@ -167,12 +199,12 @@ class MockIndexHNSWCagra(Mock):
         return _deletion_tracker.is_deleted(self.id)
 
 
-class MockIndexBinaryHNSWCagra(Mock):
+class MockIndexBinaryHNSWCagra:
     """Mock for IndexBinaryHNSWCagra"""
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.hnsw = Mock()
+        self.id = next(_mock_ids)
+        self.hnsw = SimpleNamespace()
         self.base_level_only = False
 
     def __del__(self):
@@ -183,12 +215,12 @@ class MockIndexBinaryHNSWCagra(Mock):
         return _deletion_tracker.is_deleted(self.id)
 
 
-class MockIndexBinaryHNSW(Mock):
+class MockIndexBinaryHNSW:
     """Mock for faiss.IndexBinaryHNSW"""
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.hnsw = Mock()
+        self.id = next(_mock_ids)
+        self.hnsw = SimpleNamespace()
         self.base_level_only = True
 
     def __del__(self):
@@ -200,134 +232,158 @@ class MockIndexBinaryHNSW(Mock):
 
 
 class MockIVFPQBuildCagraConfig:
-    """Mock class for faiss.IVFPQBuildCagraConfig"""
+    """Mock class for faiss.IVFPQBuildCagraConfig
 
-    def __init__(self):
-        self.n_lists = 1024
-        self.kmeans_n_iters = 20
-        self.kmeans_trainset_fraction = 0.5
-        self.pq_bits = 8
-        self.pq_dim = 0
-        self.conservative_memory_allocation = True
+    Defaults live on the class; assignments on an instance shadow them.
+    """
+
+    n_lists = 1024
+    kmeans_n_iters = 20
+    kmeans_trainset_fraction = 0.5
+    pq_bits = 8
+    pq_dim = 0
+    conservative_memory_allocation = True
 
 
 class MockIVFPQSearchCagraConfig:
     """Mock class for faiss.IVFPQSearchCagraConfig"""
 
-    def __init__(self):
-        self.n_probes = 20
+    n_probes = 20
 
 
 class MockGpuIndexCagraConfig:
     """Mock class for faiss.GpuIndexCagraConfig"""
 
-    def __init__(self):
-        self.intermediate_graph_degree = 64
-        self.graph_degree = 32
-        self.store_dataset = False
-        self.device = 0
-        self.refine_rate = 2.0
-        self.build_algo = None
-        self.ivf_pq_build_config = None
-        self.ivf_pq_search_config = None
+    intermediate_graph_degree = 64
+    graph_degree = 32
+    store_dataset = False
+    device = 0
+    refine_rate = 2.0
+    build_algo = None
+    ivf_pq_build_config = None
+    ivf_pq_search_config = None
 
 
-class FaissMock(ModuleType):
-    """Complete mock for faiss module"""
+_omp_num_threads: Optional[int] = None
 
-    def __init__(self):
-        super().__init__("faiss")
-        # Classes
-        self.StandardGpuResources = Mock()
-        self.GpuIndexCagra = MockGpuIndexCagra
-        self.GpuIndexBinaryCagra = MockGpuIndexBinaryCagra
-        self.IndexBinaryHNSWCagra = MockIndexBinaryHNSWCagra
-        self.IndexIDMap = MockIndexIDMap
-        self.IndexBinaryIDMap = MockIndexBinaryIDMap
-        self.IndexHNSWCagra = MockIndexHNSWCagra
-        self.IVFPQBuildCagraConfig = MockIVFPQBuildCagraConfig
-        self.IVFPQSearchCagraConfig = MockIVFPQSearchCagraConfig
-        self.GpuIndexCagraConfig = MockGpuIndexCagraConfig
-        self.IndexBinaryHNSW = MockIndexBinaryHNSW
-        self.Float32 = Mock()
-        self.Float16 = Mock()
-        self.Int8 = Mock()
 
-        # Constants
-        self.IO_FLAG_SKIP_STORAGE = 1
+def _omp_set_num_threads(num_threads: int) -> None:
+    global _omp_num_threads
+    _omp_num_threads = num_threads
+
+
+def _omp_get_num_threads() -> Optional[int]:
+    return _omp_num_threads
+
+
+def _index_binary_gpu_to_cpu(index):
+    if not index:
+        raise ValueError("Index cannot be None")
+    if not isinstance(index, MockGpuIndexBinaryCagra):
+        raise TypeError("Target must be GpuIndexBinaryCagra")
+    return MockIndexBinaryHNSW()
+
+
+def _write_mock_index(output_destination):
+    if isinstance(output_destination, str):
+        if _NULL_SINK:
+            _written_index_paths.append(output_destination)
+            return
+        try:
+            with open(output_destination, "wb") as f:
+                f.write(b"MOCK_INDEX_BINARY")
+        except IOError as e:
+            raise IOError(f"Failed to write to file: {str(e)}")
+    elif isinstance(output_destination, MockPyCallbackIOWriter):
+        try:
+            output_destination.callback(b"MOCK_INDEX_BINARY")
+        except IOError as e:
+            raise IOError(f"Failed to write to buffer: {str(e)}")
+    else:
+        raise TypeError("Unsupported output destination")
+
+
+def _write_index_binary(index, output_destination, io_flags=0):
+    if not isinstance(index, MockIndexBinaryIDMap):
+        raise TypeError("Target must be IndexBinaryIDMap")
+    _write_mock_index(output_destination)
+
+
+def _write_index(index, output_destination, io_flags=0):
+    if not index:
+        raise ValueError("Index cannot be None")
+    _write_mock_index(output_destination)
+
+
+@pytest.fixture
+def null_sink():
+    """Whether the mocked faiss index writers record paths instead of writing files"""
+    return _NULL_SINK
+
+
+@pytest.fixture
+def written_index_paths():
+    """File paths passed to the mocked faiss index writers while FAISS_MOCK_NULL_SINK=1"""
+    _written_index_paths.clear()
+    return _written_index_paths
 
+
+# Complete mock for the faiss module, built once as a plain module object and patched in
+faiss_mock = ModuleType("faiss")
+vars(faiss_mock).update(
+    {
+        # Classes
+        "StandardGpuResources": Mock(),
+        "GpuIndexCagra": MockGpuIndexCagra,
+        "GpuIndexBinaryCagra": MockGpuIndexBinaryCagra,
+        "IndexBinaryHNSWCagra": MockIndexBinaryHNSWCagra,
+        "IndexIDMap": MockIndexIDMap,
+        "IndexBinaryIDMap": MockIndexBinaryIDMap,
+        "IndexHNSWCagra": MockIndexHNSWCagra,
+        "IVFPQBuildCagraConfig": MockIVFPQBuildCagraConfig,
+        "IVFPQSearchCagraConfig": MockIVFPQSearchCagraConfig,
+        "GpuIndexCagraConfig": MockGpuIndexCagraConfig,
+        "IndexBinaryHNSW": MockIndexBinaryHNSW,
+        "PyCallbackIOWriter": MockPyCallbackIOWriter,
+        # Numeric types only need to be distinct sentinels
+        "Float32": object(),
+        "Float16": object(),
+        "Int8": object(),
+        # Constants
+        "IO_FLAG_SKIP_STORAGE": 1,
         # Enums
-        self.graph_build_algo_IVF_PQ = 0
-        self.graph_build_algo_NN_DESCENT = 1
-
-        self.METRIC_L2 = 0
-        self.METRIC_INNER_PRODUCT = 1
-
-        self._num_threads = None
-        self.omp_set_num_threads = self._omp_set_num_threads
-        self.omp_get_num_threads = self._omp_get_num_threads
-
-        self.write_index = self._write_index
-        self.write_index_binary = self._write_index_binary
-        self.index_binary_gpu_to_cpu = self._index_binary_gpu_to_cpu
-        self.PyCallbackIOWriter = self._PyCallbackIOWriter
-
-    def _omp_set_num_threads(self, num_threads: int) -> None:
-        self._num_threads = num_threads
-
-    def _omp_get_num_threads(self) -> int:
-        return self._num_threads
-
-    def _index_binary_gpu_to_cpu(self, index):
-        if not index:
-            raise ValueError("Index cannot be None")
-        if not isinstance(index, MockGpuIndexBinaryCagra):
-            raise TypeError("Target must be GpuIndexBinaryCagra")
-        return self.IndexBinaryHNSW()
-
-    def _write_index_binary(self, index, output_destination, io_flags=0):
-        if not isinstance(index, MockIndexBinaryIDMap):
-            raise TypeError("Target must be IndexBinaryIDMap")
-        if isinstance(output_destination, str):
-            try:
-                with open(output_destination, "wb") as f:
-                    f.write(b"MOCK_INDEX_BINARY")
-            except IOError as e:
-                raise IOError(f"Failed to write to file: {str(e)}")
-        elif isinstance(output_destination, MockPyCallbackIOWriter):
-            try:
-                output_destination.callback(b"MOCK_INDEX_BINARY")
-            except IOError as e:
-                raise IOError(f"Failed to write to buffer: {str(e)}")
-        else:
-            raise TypeError("Unsupported output destination")
-
-    def _write_index(self, index, output_destination, io_flags=0):
-        if not index:
-            raise ValueError("Index cannot be None")
-        if isinstance(output_destination, str):
-            try:
-                with open(output_destination, "wb") as f:
-                    f.write(b"MOCK_INDEX_BINARY")
-            except IOError as e:
-                raise IOError(f"Failed to write to file: {str(e)}")
-        elif isinstance(output_destination, MockPyCallbackIOWriter):
-            try:
-                output_destination.callback(b"MOCK_INDEX_BINARY")
-            except IOError as e:
-                raise IOError(f"Failed to write to buffer: {str(e)}")
-        else:
-            raise TypeError("Unsupported output destination")
-
-    def _PyCallbackIOWriter(self, callback):
-        return MockPyCallbackIOWriter(callback)
-
-
-# Create the mock and patch faiss
-faiss_mock = FaissMock()
+        "graph_build_algo_IVF_PQ": 0,
+        "graph_build_algo_NN_DESCENT": 1,
+        "METRIC_L2": 0,
+        "METRIC_INNER_PRODUCT": 1,
+        # Functions
+        "omp_set_num_threads": _omp_set_num_threads,
+        "omp_get_num_threads": _omp_get_num_threads,
+        "write_index": _write_index,
+        "write_index_binary": _write_index_binary,
+        "index_binary_gpu_to_cpu": _index_binary_gpu_to_cpu,
+    }
+)
+
 sys.modules["faiss"] = faiss_mock
 
 
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+# Sample arrays are built once at import and shared by every test, so they are
+# read-only to make accidental in-place mutation fail loudly
+_SAMPLE_VALUES = np.arange(1, 16).reshape(5, 3)
+_SAMPLE_VECTORS = _read_only(_SAMPLE_VALUES.astype(np.float32))
+_SAMPLE_BINARY_VECTORS = _read_only(_SAMPLE_VALUES.astype(np.uint8))
+_SAMPLE_BYTE_VECTORS = _read_only(_SAMPLE_VALUES.astype(np.int8))
+_SAMPLE_FP16_VECTORS = _read_only(_SAMPLE_VALUES.astype(np.float16))
+# A view over the packed bytes, which is read-only already
+_SAMPLE_DOC_IDS = np.frombuffer(struct.pack("<5i", 1, 2, 3, 4, 5), dtype=np.int32)
+
+
 @pytest.fixture
 def object_store_config():
     """Create a sample object store configuration for testing"""
@@ -336,70 +392,82 @@ def object_store_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_vectors():
     """Generate sample vectors for testing"""
-    return np.array(
-        [
-            [1.0, 2.0, 3.0],
-            [4.0, 5.0, 6.0],
-            [7.0, 8.0, 9.0],
-            [10.0, 11.0, 12.0],
-            [13.0, 14.0, 15.0],
-        ],
-        dtype=np.float32,
-    )
+    return _SAMPLE_VECTORS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_binary_vectors():
     """Generate sample binary vectors for testing"""
-    return np.array(
-        [
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 9],
-            [10, 11, 12],
-            [13, 14, 15],
-        ],
-        dtype=np.uint8,
-    )
+    return _SAMPLE_BINARY_VECTORS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_byte_vectors():
     """Generate sample byte vectors for testing"""
-    return np.array(
-        [
-            [1, 2, 3],
-            [4, 5, 6],
-            [7, 8, 9],
-            [10, 11, 12],
-            [13, 14, 15],
-        ],
-        dtype=np.int8,
-    )
+    return _SAMPLE_BYTE_VECTORS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_fp16_vectors():
     """Generate sample fp16 vectors for testing"""
-    return np.array(
-        [
-            [1.0, 2.0, 3.0],
-            [4.0, 5.0, 6.0],
-            [7.0, 8.0, 9.0],
-            [10.0, 11.0, 12.0],
-            [13.0, 14.0, 15.0],
-        ],
-        dtype=np.float16,
-    )
+    return _SAMPLE_FP16_VECTORS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_doc_ids():
     """Generate sample document IDs for testing"""
-    return np.array([1, 2, 3, 4, 5], dtype=np.int32)
+    return _SAMPLE_DOC_IDS
+
+
+@pytest.fixture(scope="module")
+def sample_vectors_bytes(sample_vectors):
+    """Serialized sample vectors, computed once and shared by every consumer in the module"""
+    return sample_vectors.tobytes()
+
+
+@pytest.fixture(scope="module")
+def sample_binary_vectors_bytes(sample_binary_vectors):
+    """Serialized sample binary vectors"""
+    return sample_binary_vectors.tobytes()
+
+
+@pytest.fixture(scope="module")
+def sample_byte_vectors_bytes(sample_byte_vectors):
+    """Serialized sample byte vectors"""
+    return sample_byte_vectors.tobytes()
+
+
+@pytest.fixture(scope="module")
+def sample_doc_ids_bytes(sample_doc_ids):
+    """Serialized sample document IDs"""
+    return sample_doc_ids.tobytes()
+
+
+@pytest.fixture(scope="module")
+def sample_vectors_buffer(sample_vectors):
+    """Byte view over the sample vectors' storage, without an intermediate bytes copy"""
+    return memoryview(sample_vectors).cast("B")
+
+
+@pytest.fixture(scope="module")
+def sample_binary_vectors_buffer(sample_binary_vectors):
+    """Byte view over the sample binary vectors' storage"""
+    return memoryview(sample_binary_vectors).cast("B")
+
+
+@pytest.fixture(scope="module")
+def sample_byte_vectors_buffer(sample_byte_vectors):
+    """Byte view over the sample byte vectors' storage"""
+    return memoryview(sample_byte_vectors).cast("B")
+
+
+@pytest.fixture(scope="module")
+def sample_doc_ids_buffer(sample_doc_ids):
+    """Byte view over the sample document IDs' storage"""
+    return memoryview(sample_doc_ids).cast("B")
 
 
 @pytest.fixture
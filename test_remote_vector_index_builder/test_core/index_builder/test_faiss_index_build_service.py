@@ -7,7 +7,7 @@
 
 import faiss
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 import os
 
 from core.common.models import IndexSerializationMode
@@ -18,72 +18,96 @@ from core.index_builder.faiss.faiss_index_build_service import FaissIndexBuildSe
 from core.index_builder.index_builder_utils import calculate_ivf_pq_n_lists
 from core.common.models.index_builder.faiss import FaissIndexHNSWCagraBuilder
 
+# (vectors dataset fixture, index build parameters fixture) for each supported data type
+DATASET_CASES = [
+    pytest.param("vectors_dataset", "index_build_parameters", id="float"),
+    pytest.param("byte_vectors_dataset", "byte_index_build_parameters", id="byte"),
+    pytest.param("fp16_vectors_dataset", "byte_index_build_parameters", id="fp16"),
+    pytest.param(
+        "binary_vectors_dataset", "binary_index_build_parameters", id="binary"
+    ),
+]
+
 
 class TestFaissIndexBuildService:
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        with patch("os.cpu_count", return_value=8):
-            service = FaissIndexBuildService()
-            assert service.omp_num_threads == 2
-            return service
+        # The service holds no per-build state, so one instance serves every test
+        with patch("os.cpu_count", return_value=8), patch(
+            "os.sched_getaffinity", return_value=set(range(8)), create=True
+        ):
+            return FaissIndexBuildService()
 
-    def test_build_index_success(
-        self, service, vectors_dataset, index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_success(
-            service, vectors_dataset, index_build_parameters, tmp_path
-        )
+    @pytest.fixture
+    def mock_gpu_from_dict(self, monkeypatch):
+        mock = Mock(return_value=FaissGPUIndexCagraBuilder())
+        monkeypatch.setattr(FaissGPUIndexCagraBuilder, "from_dict", mock)
+        return mock
 
-    def test_build_byte_index_success(
-        self, service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_success(
-            service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
+    def test_omp_num_threads(self, service):
+        assert service.omp_num_threads == 2  # 8 CPUs/4 = 2 threads
 
-    def test_build_fp16_index_success(
-        self, service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_success(
-            service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
+    def test_omp_num_threads_uses_affinity_mask(self):
+        with patch("os.cpu_count", return_value=64), patch(
+            "os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True
+        ):
+            assert FaissIndexBuildService().omp_num_threads == 1
 
-    def test_build_binary_index_success(
-        self, service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
+    @pytest.mark.parametrize("dataset_fixture, params_fixture", DATASET_CASES)
+    def test_build_index_success(
+        self,
+        request,
+        service,
+        dataset_fixture,
+        params_fixture,
+        tmp_path,
+        written_index_paths,
+        null_sink,
+        mock_gpu_from_dict,
     ):
         self._do_test_build_index_success(
-            service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
+            service,
+            request.getfixturevalue(dataset_fixture),
+            request.getfixturevalue(params_fixture),
+            tmp_path,
+            written_index_paths,
+            null_sink,
+            mock_gpu_from_dict,
         )
 
     def _do_test_build_index_success(
-        self, service, vectors_dataset, index_build_parameters, tmp_path
+        self,
+        service,
+        vectors_dataset,
+        index_build_parameters,
+        tmp_path,
+        written_index_paths,
+        null_sink,
+        mock_gpu_from_dict,
     ):
-        with patch(
-            "core.common.models.index_builder.faiss.FaissGPUIndexCagraBuilder.from_dict"
-        ) as mock_gpu_from_dict:
+        output_path = str(tmp_path / "output.index")
 
-            output_path = str(tmp_path / "output.index")
-            mock_gpu_from_dict.return_value = FaissGPUIndexCagraBuilder()
-
-            cpu_index_output = service.build_index(
-                index_build_parameters, vectors_dataset
-            )
-            service.write_cpu_index(
-                cpu_index_output,
-                index_build_parameters,
-                IndexSerializationMode.DISK,
-                output_path,
-            )
+        cpu_index_output = service.build_index(index_build_parameters, vectors_dataset)
+        service.write_cpu_index(
+            cpu_index_output,
+            index_build_parameters,
+            IndexSerializationMode.DISK,
+            output_path,
+        )
 
-            # Ensuring that FaissGPUIndexCagraBuilder parameters are set correctly
-            expected_params = self._get_expected_gpu_params(
-                service, index_build_parameters
-            )
-            mock_gpu_from_dict.assert_called_once_with(expected_params)
+        # Ensuring that FaissGPUIndexCagraBuilder parameters are set correctly
+        expected_params = self._get_expected_gpu_params(service, index_build_parameters)
+        mock_gpu_from_dict.assert_called_once_with(expected_params)
 
-            assert faiss.omp_get_num_threads() == 2  # 8 CPUs/4 = 2 threads
+        assert faiss.omp_get_num_threads() == 2  # 8 CPUs/4 = 2 threads
+        # With FAISS_MOCK_NULL_SINK=1 the mock records the path instead of writing it
+        if null_sink:
+            assert written_index_paths == [output_path]
+            assert not os.path.exists(output_path)
+        else:
             assert os.path.exists(output_path)
+            assert written_index_paths == []
 
     def test_write_cpu_index_memory_mode(
         self, service, vectors_dataset, index_build_parameters
@@ -150,33 +174,15 @@ class TestFaissIndexBuildService:
                 * 4,
             }
 
+    @pytest.mark.parametrize("dataset_fixture, params_fixture", DATASET_CASES)
     def test_build_index_gpu_creation_error(
-        self, service, vectors_dataset, index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_gpu_creation_error(
-            service, vectors_dataset, index_build_parameters, tmp_path
-        )
-
-    def test_build_byte_index_gpu_creation_error(
-        self, service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
+        self, request, service, dataset_fixture, params_fixture, tmp_path
     ):
         self._do_test_build_index_gpu_creation_error(
-            service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_fp16_index_gpu_creation_error(
-        self, service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_gpu_creation_error(
-            service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_binary_index_gpu_creation_error(
-        self, service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
-    ):
-        pass
-        self._do_test_build_index_gpu_creation_error(
-            service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
+            service,
+            request.getfixturevalue(dataset_fixture),
+            request.getfixturevalue(params_fixture),
+            tmp_path,
         )
 
     def _do_test_build_index_gpu_creation_error(
@@ -194,32 +200,15 @@ class TestFaissIndexBuildService:
 
             assert "GPU creation failed" in str(exc_info.value)
 
+    @pytest.mark.parametrize("dataset_fixture, params_fixture", DATASET_CASES)
     def test_build_index_cpu_conversion_error(
-        self, service, vectors_dataset, index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_cpu_conversion_error(
-            service, vectors_dataset, index_build_parameters, tmp_path
-        )
-
-    def test_build_byte_index_cpu_conversion_error(
-        self, service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
+        self, request, service, dataset_fixture, params_fixture, tmp_path
     ):
         self._do_test_build_index_cpu_conversion_error(
-            service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_fp16_index_cpu_conversion_error(
-        self, service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_cpu_conversion_error(
-            service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_binary_index_cpu_conversion_error(
-        self, service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_cpu_conversion_error(
-            service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
+            service,
+            request.getfixturevalue(dataset_fixture),
+            request.getfixturevalue(params_fixture),
+            tmp_path,
         )
 
     def _do_test_build_index_cpu_conversion_error(
@@ -237,32 +226,15 @@ class TestFaissIndexBuildService:
 
             assert "Conversion failed" in str(exc_info.value)
 
+    @pytest.mark.parametrize("dataset_fixture, params_fixture", DATASET_CASES)
     def test_build_index_write_error(
-        self, service, vectors_dataset, index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_write_error(
-            service, vectors_dataset, index_build_parameters, tmp_path
-        )
-
-    def test_build_byte_index_write_error(
-        self, service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
+        self, request, service, dataset_fixture, params_fixture, tmp_path
     ):
         self._do_test_build_index_write_error(
-            service, byte_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_fp16_index_write_error(
-        self, service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_write_error(
-            service, fp16_vectors_dataset, byte_index_build_parameters, tmp_path
-        )
-
-    def test_build_binary_index_write_error(
-        self, service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
-    ):
-        self._do_test_build_index_write_error(
-            service, binary_vectors_dataset, binary_index_build_parameters, tmp_path
+            service,
+            request.getfixturevalue(dataset_fixture),
+            request.getfixturevalue(params_fixture),
+            tmp_path,
         )
 
     def _do_test_build_index_write_error(
@@ -299,16 +271,12 @@ class TestFaissIndexBuildService:
         vectors_dataset,
         skip_stored_vectors_index_build_parameters,
         tmp_path,
+        mock_gpu_from_dict,
     ):
         """Test that skip_stored_vectors=True is passed through to CPU index builder"""
         with patch(
-            "core.common.models.index_builder.faiss.FaissGPUIndexCagraBuilder.from_dict"
-        ) as mock_gpu_from_dict, patch(
             "core.common.models.index_builder.faiss.FaissIndexHNSWCagraBuilder.from_dict"
         ) as mock_cpu_from_dict:
-            from core.common.models.index_builder.faiss import FaissGPUIndexCagraBuilder
-
-            mock_gpu_from_dict.return_value = FaissGPUIndexCagraBuilder()
             mock_cpu_from_dict.return_value = FaissIndexHNSWCagraBuilder(
                 skip_stored_vectors=True
             )
@@ -326,16 +294,12 @@ class TestFaissIndexBuildService:
         binary_vectors_dataset,
         skip_stored_vectors_binary_index_build_parameters,
         tmp_path,
+        mock_gpu_from_dict,
     ):
         """Test that skip_stored_vectors=True is passed through to CPU index builder for binary"""
         with patch(
-            "core.common.models.index_builder.faiss.FaissGPUIndexCagraBuilder.from_dict"
-        ) as mock_gpu_from_dict, patch(
             "core.common.models.index_builder.faiss.FaissIndexHNSWCagraBuilder.from_dict"
         ) as mock_cpu_from_dict:
-            from core.common.models.index_builder.faiss import FaissGPUIndexCagraBuilder
-
-            mock_gpu_from_dict.return_value = FaissGPUIndexCagraBuilder()
             mock_cpu_from_dict.return_value = FaissIndexHNSWCagraBuilder(
                 skip_stored_vectors=True, vector_dtype=DataType.BINARY
             )
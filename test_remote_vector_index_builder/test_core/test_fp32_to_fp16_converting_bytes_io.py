@@ -8,6 +8,12 @@ dimension = 64
 n_vectors = 100
 total_vectors = dimension * n_vectors
 
+# One deterministic dataset shared by every test; the tests only read from it
+_FP32_VALUES = (
+    np.random.default_rng(0).uniform(-100, 100, size=total_vectors).astype(np.float32)
+)
+_FP32_BYTES = _FP32_VALUES.tobytes()
+
 
 def _test_fp32_to_fp16_conversion(fp32: np.ndarray, fp16: np.ndarray):
     assert fp32.dtype == np.float32, "Input array 'fp32' must be of dtype float32"
@@ -20,8 +26,8 @@ def _test_fp32_to_fp16_conversion(fp32: np.ndarray, fp16: np.ndarray):
 
 def test1_perfect_match():
     bytes_io = FP32ToFP16ConvertingBytesIO(total_vectors)
-    fp32_values = np.random.uniform(-100, 100, size=total_vectors).astype(np.float32)
-    bytes_to_write = fp32_values.tobytes()
+    fp32_values = _FP32_VALUES
+    bytes_to_write = _FP32_BYTES
 
     # Write first 10 vectors
     bytes_io.seek(0)
@@ -43,10 +49,8 @@ def test2_incomplete_bytes_leading():
     offsets = [1, 2, 3]
     for o in offsets:
         bytes_io = FP32ToFP16ConvertingBytesIO(total_vectors)
-        fp32_values = np.random.uniform(-100, 100, size=total_vectors).astype(
-            np.float32
-        )
-        bytes_to_write = fp32_values.tobytes()
+        fp32_values = _FP32_VALUES
+        bytes_to_write = _FP32_BYTES
         org_bytes_to_write = bytes_to_write
 
         # Write 'incomplete bytes of 4th vector' + '10 vectors' after
@@ -92,10 +96,8 @@ def test3_incomplete_bytes_trailing():
     offsets = [1, 2, 3]
     for o in offsets:
         bytes_io = FP32ToFP16ConvertingBytesIO(total_vectors)
-        fp32_values = np.random.uniform(-100, 100, size=total_vectors).astype(
-            np.float32
-        )
-        bytes_to_write = fp32_values.tobytes()
+        fp32_values = _FP32_VALUES
+        bytes_to_write = _FP32_BYTES
         org_bytes_to_write = bytes_to_write
 
         # Write '10 vectors' + 'incomplete bytes of 5th vector' after 4 vectors.
@@ -141,10 +143,8 @@ def test4_incomplete_bytes_leading_trailing():
     for o in offsets:
         for o2 in offsets:
             bytes_io = FP32ToFP16ConvertingBytesIO(total_vectors)
-            fp32_values = np.random.uniform(-100, 100, size=total_vectors).astype(
-                np.float32
-            )
-            bytes_to_write = fp32_values.tobytes()
+            fp32_values = _FP32_VALUES
+            bytes_to_write = _FP32_BYTES
 
             # Convert fp32[5:15] + incomplete bytes in 4th + incomplete bytes in 15th
             write_start_offset = 20 - o
@@ -185,3 +185,22 @@ def test4_incomplete_bytes_leading_trailing():
                 )
                 j += 1
                 i += 1
+
+
+def test5_memoryview_input():
+    bytes_io = FP32ToFP16ConvertingBytesIO(total_vectors)
+    fp32_values = _FP32_VALUES
+    view = memoryview(_FP32_BYTES)
+
+    # Leading and trailing fragments around 10 complete vectors, passed without copying
+    bytes_io.seek(4 * 3 + 2)
+    ret = bytes_io.write(view[4 * 3 + 2 : 4 * 14 + 1])
+    assert ret == 4 * 11 - 1
+    _test_fp32_to_fp16_conversion(fp32_values[4:14], bytes_io._fp16_np[4:14])
+
+    bytes_io.seek(4 * 3)
+    bytes_io.write(view[4 * 3 : 4 * 3 + 2])
+    bytes_io.seek(4 * 14 + 1)
+    bytes_io.write(view[4 * 14 + 1 : 4 * 15])
+    _test_fp32_to_fp16_conversion(fp32_values[3:15], bytes_io._fp16_np[3:15])
+    assert not bytes_io._incomplete_vector_value
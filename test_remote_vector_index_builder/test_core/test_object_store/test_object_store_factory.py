@@ -14,11 +14,13 @@ from core.object_store.types import ObjectStoreType
 def test_create_s3_object_store(index_build_parameters, object_store_config):
     """Test creating an S3 object store"""
     # Setup
-    index_build_parameters.repository_type = ObjectStoreType.S3
+    s3_parameters = index_build_parameters.model_copy(
+        update={"repository_type": ObjectStoreType.S3}
+    )
 
     # Execute
     store = ObjectStoreFactory.create_object_store(
-        index_build_params=index_build_parameters,
+        index_build_params=s3_parameters,
         object_store_config=object_store_config,
     )
 
@@ -31,11 +33,13 @@ def test_create_object_store_unsupported_type(
 ):
     """Test creating an object store with unsupported type raises error"""
     # Setup
-    index_build_parameters.repository_type = "unsupported_type"
+    unsupported_parameters = index_build_parameters.model_copy(
+        update={"repository_type": "unsupported_type"}
+    )
 
     # Execute and Assert
     with pytest.raises(UnsupportedObjectStoreTypeError):
         ObjectStoreFactory.create_object_store(
-            index_build_params=index_build_parameters,
+            index_build_params=unsupported_parameters,
             object_store_config=object_store_config,
         )
@@ -5,15 +5,25 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import time
 from io import BytesIO
-from unittest.mock import ANY, Mock, patch
+from threading import Barrier
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 from botocore.config import Config
 from boto3.s3.transfer import TransferConfig
-from botocore.exceptions import ClientError
+from botocore.exceptions import (
+    ClientError,
+    EndpointConnectionError,
+    IncompleteReadError,
+)
 from core.common.exceptions import BlobError
-from core.object_store.s3.s3_object_store import S3ObjectStore, get_boto3_client
+from core.object_store.s3.s3_object_store import (
+    PROGRESS_REPORT_INTERVAL_BYTES,
+    S3ObjectStore,
+    get_boto3_client,
+)
 from core.object_store.s3.s3_object_store_config import S3ClientConfig
 
 
@@ -24,6 +34,20 @@ def mock_logger():
         yield
 
 
+@pytest.fixture(scope="module")
+def mock_get_boto3_client():
+    # Patched once for the module rather than in every test
+    with patch("core.object_store.s3.s3_object_store.get_boto3_client") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_s3_client(mock_get_boto3_client):
+    # A fresh client per test, so side effects configured by one test cannot leak into the next
+    mock_get_boto3_client.return_value = MagicMock()
+    return mock_get_boto3_client.return_value
+
+
 @pytest.fixture
 def object_store_config():
     return {
@@ -42,9 +66,7 @@ def object_store_config():
 
 @pytest.fixture
 def s3_object_store(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        yield store
+    return S3ObjectStore(index_build_parameters, object_store_config)
 
 
 @pytest.fixture
@@ -86,6 +108,8 @@ def test_get_boto3_client():
         calls = mock_client.call_args_list
         assert isinstance(calls[0][1]["config"], Config)
         assert calls[0][1]["config"].retries["max_attempts"] == 4
+        # the pool must hold at least the default download concurrency cap
+        assert calls[0][1]["config"].max_pool_connections >= 32
 
         # Test different parameters create new client
         client3 = get_boto3_client(
@@ -108,36 +132,70 @@ def test_get_boto3_client():
         assert client3 != client4
         assert mock_client.call_count == 3
 
+        client5 = get_boto3_client(
+            S3ClientConfig(
+                region_name="us-east-1",
+                max_retries=3,
+                endpoint_url="test_url",
+                max_pool_connections=128,
+            )
+        )
+        assert client4 != client5
+        assert mock_client.call_args[1]["config"].max_pool_connections == 128
+
 
 def test_s3_object_store_initialization(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        assert store.bucket == index_build_parameters.container_name
-        assert store.max_retries == object_store_config["s3_client_config"].max_retries
-        assert store.region == object_store_config["s3_client_config"].region_name
-        assert (
-            store.download_transfer_config["max_concurrency"]
-            == object_store_config["download_transfer_config"]["max_concurrency"]
-        )
-        assert (
-            store.upload_transfer_config["max_concurrency"]
-            == object_store_config["upload_transfer_config"]["max_concurrency"]
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    assert store.bucket == index_build_parameters.container_name
+    assert store.max_retries == object_store_config["s3_client_config"].max_retries
+    assert store.region == object_store_config["s3_client_config"].region_name
+    assert (
+        store.download_transfer_config["max_concurrency"]
+        == object_store_config["download_transfer_config"]["max_concurrency"]
+    )
+    assert (
+        store.upload_transfer_config["max_concurrency"]
+        == object_store_config["upload_transfer_config"]["max_concurrency"]
+    )
+    assert not store.debug
+
+
+@pytest.mark.parametrize(
+    "cpu_count, expected_concurrency", [(2, 8), (4, 16), (64, 32), (None, 1)]
+)
+def test_s3_object_store_initialization_download_defaults(
+    index_build_parameters, cpu_count, expected_concurrency
+):
+    with patch("os.cpu_count", return_value=cpu_count):
+        store = S3ObjectStore(
+            index_build_parameters,
+            {"s3_client_config": S3ClientConfig(region_name="us-west-2")},
         )
-        assert not store.debug
+    assert store.download_transfer_config["max_concurrency"] == expected_concurrency
+    assert store.download_transfer_config["multipart_threshold"] == 8 * 1024 * 1024
+    assert store.download_transfer_config["multipart_chunksize"] == 8 * 1024 * 1024
 
 
 # also test if os.cpu_count is none
 def test_s3_object_store_initialization_debug_config(index_build_parameters):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        with patch("os.cpu_count", return_value=None):
-            store = S3ObjectStore(
-                index_build_parameters,
-                {
-                    "debug": True,
-                    "s3_client_config": S3ClientConfig(region_name="us-west-2"),
-                },
-            )
-            assert store.debug
+    with patch("os.cpu_count", return_value=None):
+        store = S3ObjectStore(
+            index_build_parameters,
+            {
+                "debug": True,
+                "s3_client_config": S3ClientConfig(region_name="us-west-2"),
+            },
+        )
+        assert store.debug
+
+
+@pytest.mark.parametrize("has_crt, algorithm", [(True, "CRC32C"), (False, "CRC32")])
+def test_default_checksum_algorithm(
+    index_build_parameters, object_store_config, has_crt, algorithm
+):
+    with patch("core.object_store.s3.s3_object_store.HAS_CRT", has_crt):
+        store = S3ObjectStore(index_build_parameters, object_store_config)
+    assert store.upload_args["ChecksumAlgorithm"] == algorithm
 
 
 def test_create_custom_config(index_build_parameters):
@@ -159,203 +217,376 @@ def test_create_custom_config(index_build_parameters):
         ),
     }
 
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, custom_config)
-        assert store.max_retries == custom_config["s3_client_config"].max_retries
-        assert store.region == custom_config["s3_client_config"].region_name
-        assert not store.debug
-        assert store.download_transfer_config["multipart_chunksize"] == 20 * 1024 * 1024
-        assert store.download_transfer_config["max_concurrency"] == 8
-        assert store.download_args["ChecksumMode"] == "DISABLED"
-
-        assert store.upload_transfer_config["max_concurrency"] == 8
-        assert (
-            store.upload_transfer_config["multipart_chunksize"]
-            == store.DEFAULT_UPLOAD_TRANSFER_CONFIG["multipart_chunksize"]
-        )
-        assert store.upload_args["ChecksumAlgorithm"] == "SHA1"
+    store = S3ObjectStore(index_build_parameters, custom_config)
+    assert store.max_retries == custom_config["s3_client_config"].max_retries
+    assert store.region == custom_config["s3_client_config"].region_name
+    assert not store.debug
+    assert store.download_transfer_config["multipart_chunksize"] == 20 * 1024 * 1024
+    assert store.download_transfer_config["max_concurrency"] == 8
+    assert store.download_args["ChecksumMode"] == "DISABLED"
 
-        # In production, if boto3 does not support 'param', it will throw an exception
-        # So, no need for the object store client to also validate the params, during construction
-        assert "param" in store.download_transfer_config
-        assert "param" in store.download_args
-        assert "param" in store.upload_args
+    assert store.upload_transfer_config["max_concurrency"] == 8
+    assert (
+        store.upload_transfer_config["multipart_chunksize"]
+        == store.DEFAULT_UPLOAD_TRANSFER_CONFIG["multipart_chunksize"]
+    )
+    assert store.upload_args["ChecksumAlgorithm"] == "SHA1"
 
+    # In production, if boto3 does not support 'param', it will throw an exception
+    # So, no need for the object store client to also validate the params, during construction
+    assert "param" in store.download_transfer_config
+    assert "param" in store.download_args
+    assert "param" in store.upload_args
 
-def test_read_blob_success(index_build_parameters, object_store_config, bytes_buffer):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        store.s3_client.download_fileobj = Mock()
 
-        store.read_blob("test/path", bytes_buffer)
-        store.s3_client.download_fileobj.assert_called_once()
-        assert isinstance(
-            store.s3_client.download_fileobj.call_args.kwargs["Config"], TransferConfig
-        )
-        # validate a transfer config parameter matches the object_store_config parameter
-        assert (
-            store.s3_client.download_fileobj.call_args.kwargs["Config"].__dict__[
-                "max_concurrency"
-            ]
-            == store.download_transfer_config["max_concurrency"]
-        )
-        assert store.s3_client.download_fileobj.call_args.kwargs["Callback"] is None
-        assert (
-            store.s3_client.download_fileobj.call_args.kwargs["ExtraArgs"]
-            == store.download_args
-        )
-        assert store.s3_client.download_fileobj.call_args.args == (
-            store.bucket,
-            "test/path",
-            bytes_buffer,
-        )
+def test_read_blob_success(index_build_parameters, object_store_config, bytes_buffer):
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.download_fileobj = Mock()
+
+    store.read_blob("test/path", bytes_buffer)
+    store.s3_client.download_fileobj.assert_called_once()
+    assert isinstance(
+        store.s3_client.download_fileobj.call_args.kwargs["Config"], TransferConfig
+    )
+    # validate a transfer config parameter matches the object_store_config parameter
+    assert (
+        store.s3_client.download_fileobj.call_args.kwargs["Config"].__dict__[
+            "max_concurrency"
+        ]
+        == store.download_transfer_config["max_concurrency"]
+    )
+    assert store.s3_client.download_fileobj.call_args.kwargs["Callback"] is None
+    assert (
+        store.s3_client.download_fileobj.call_args.kwargs["ExtraArgs"]
+        == store.download_args
+    )
+    assert store.s3_client.download_fileobj.call_args.args == (
+        store.bucket,
+        "test/path",
+        bytes_buffer,
+    )
+
+    # the TransferConfig is built once and reused by later downloads
+    first_config = store.s3_client.download_fileobj.call_args.kwargs["Config"]
+    store.read_blob("test/other_path", bytes_buffer)
+    assert store.s3_client.download_fileobj.call_args.kwargs["Config"] is first_config
+
+
+def _report_progress(store, progress_attr):
+    """Side effect for a mocked boto3 transfer that reports progress through its Callback."""
+
+    def transfer(*args, Callback, **kwargs):
+        assert getattr(store, progress_attr) == 0
+        Callback(100)  # Simulate 100 bytes transferred
+        # progress below the report interval is held back
+        assert getattr(store, progress_attr) == 0
+        Callback(PROGRESS_REPORT_INTERVAL_BYTES - 100)
+        assert getattr(store, progress_attr) == PROGRESS_REPORT_INTERVAL_BYTES
+        Callback(50)  # Simulate 50 more bytes
+        assert getattr(store, progress_attr) == PROGRESS_REPORT_INTERVAL_BYTES
+
+    return transfer
 
 
 def test_read_blob_with_debug(
     index_build_parameters, object_store_config, bytes_buffer
 ):
     object_store_config["debug"] = True
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        store.s3_client.download_fileobj = Mock()
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.download_fileobj = Mock(
+        side_effect=_report_progress(store, "_read_progress")
+    )
 
-        store.read_blob("test/path", bytes_buffer)
+    store.read_blob("test/path", bytes_buffer)
 
-        # Verify callback was passed
-        callback = store.s3_client.download_fileobj.call_args.kwargs["Callback"]
-        assert callback is not None
-        # Test the callback directly
-        assert store._read_progress == 0
-        callback(100)  # Simulate 100 bytes transferred
-        assert store._read_progress == 100
-        callback(50)  # Simulate 50 more bytes
-        assert store._read_progress == 150
+    # Verify callback was passed
+    assert store.s3_client.download_fileobj.call_args.kwargs["Callback"] is not None
+    # the bytes held back below the report interval are published when the download ends
+    assert store._read_progress == PROGRESS_REPORT_INTERVAL_BYTES + 50
 
 
-def test_read_blob_client_error_failure(
+def test_read_blob_small_fastpath_with_debug(
     index_build_parameters, object_store_config, bytes_buffer
 ):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        error = ClientError(
-            {"Error": {"Code": "LimitExceededException", "Message": "Limit Exceeded"}},
-            "DownloadFileObj",
-        )
-        store.s3_client.download_fileobj.side_effect = error
-        with pytest.raises(BlobError):
-            store.read_blob("test/path", bytes_buffer)
+    object_store_config["debug"] = True
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.get_object.return_value = {
+        "Body": BytesIO(b"doc-ids"),
+        "ContentLength": 7,
+    }
 
+    store.read_blob("test/doc_ids", bytes_buffer, size_hint=7)
 
-def test_read_blob_type_error_failure(
-    index_build_parameters, object_store_config, bytes_buffer
+    assert store._read_progress == 7
+
+
+def test_read_blob_debug_progress_is_kept_per_download(
+    index_build_parameters, object_store_config
 ):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        error = TypeError(
-            "TransferConfig.__init__() got an unexpected keyword argument"
-        )
-        store.s3_client.upload_file.side_effect = error
-        store.s3_client.download_fileobj.side_effect = error
-        with pytest.raises(BlobError):
-            store.read_blob("test/path", bytes_buffer)
+    object_store_config["debug"] = True
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.download_fileobj = Mock()
 
+    store.read_blob("test/vectors", BytesIO())
+    vectors_callback = store.s3_client.download_fileobj.call_args.kwargs["Callback"]
+    vectors_callback(PROGRESS_REPORT_INTERVAL_BYTES)
 
-def test_write_blob_from_disk_success(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        store.s3_client.upload_file = Mock()
-        store.write_blob("local/path", "remote/path")
+    # starting a second download must not reset the progress of the first
+    store.read_blob("test/doc_ids", BytesIO())
+    doc_ids_callback = store.s3_client.download_fileobj.call_args.kwargs["Callback"]
+    doc_ids_callback(PROGRESS_REPORT_INTERVAL_BYTES)
+    vectors_callback(PROGRESS_REPORT_INTERVAL_BYTES)
 
-        store.s3_client.upload_file.assert_called_once()
-        assert isinstance(
-            store.s3_client.upload_file.call_args.kwargs["Config"], TransferConfig
-        )
-        # validate a transfer config parameter matches the object_store_config parameter
-        assert (
-            store.s3_client.upload_file.call_args.kwargs["Config"].__dict__[
-                "max_concurrency"
-            ]
-            == store.upload_transfer_config["max_concurrency"]
-        )
-        assert store.s3_client.upload_file.call_args.kwargs["Callback"] is None
-        assert (
-            store.s3_client.upload_file.call_args.kwargs["ExtraArgs"]
-            == store.upload_args
-        )
-        assert store.s3_client.upload_file.call_args.args == (
-            "local/path",
-            store.bucket,
-            "remote/path",
-        )
+    assert store._read_progress == 3 * PROGRESS_REPORT_INTERVAL_BYTES
 
 
-def test_write_blob_from_buffer_success(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        store.s3_client.upload_file = Mock()
-        bytes_buffer = BytesIO()
-        store.write_blob(bytes_buffer, "remote/path")
+def test_read_blob_small_fastpath(s3_object_store, bytes_buffer):
+    s3_object_store.s3_client.get_object.return_value = {
+        "Body": BytesIO(b"doc-ids"),
+        "ContentLength": 7,
+    }
 
-        store.s3_client.upload_fileobj.assert_called_once()
-        assert isinstance(
-            store.s3_client.upload_fileobj.call_args.kwargs["Config"], TransferConfig
-        )
-        # validate a transfer config parameter matches the object_store_config parameter
-        assert (
-            store.s3_client.upload_fileobj.call_args.kwargs["Config"].__dict__[
-                "max_concurrency"
-            ]
-            == store.upload_transfer_config["max_concurrency"]
-        )
-        assert store.s3_client.upload_fileobj.call_args.kwargs["Callback"] is None
-        assert (
-            store.s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
-            == store.upload_args
+    s3_object_store.read_blob("test/doc_ids", bytes_buffer, size_hint=7)
+
+    s3_object_store.s3_client.get_object.assert_called_once_with(
+        Bucket=s3_object_store.bucket,
+        Key="test/doc_ids",
+        **s3_object_store.download_args,
+    )
+    s3_object_store.s3_client.download_fileobj.assert_not_called()
+    assert bytes_buffer.getvalue() == b"doc-ids"
+
+
+class _FailingBody:
+    def read(self, *args):
+        raise IncompleteReadError(actual_bytes=3, expected_bytes=7)
+
+
+def test_read_blob_small_fastpath_retries_body_errors(s3_object_store, bytes_buffer):
+    s3_object_store.s3_client.get_object.side_effect = [
+        {"Body": _FailingBody(), "ContentLength": 7},
+        {"Body": BytesIO(b"doc-ids"), "ContentLength": 7},
+    ]
+
+    s3_object_store.read_blob("test/doc_ids", bytes_buffer, size_hint=7)
+
+    assert s3_object_store.s3_client.get_object.call_count == 2
+    assert bytes_buffer.getvalue() == b"doc-ids"
+
+
+def test_read_blob_small_fastpath_body_errors_exhaust_retries(
+    s3_object_store, bytes_buffer
+):
+    s3_object_store.s3_client.get_object.side_effect = lambda **kwargs: {
+        "Body": _FailingBody(),
+        "ContentLength": 7,
+    }
+
+    with pytest.raises(BlobError):
+        s3_object_store.read_blob("test/doc_ids", bytes_buffer, size_hint=7)
+
+    assert (
+        s3_object_store.s3_client.get_object.call_count
+        == s3_object_store.max_retries + 1
+    )
+
+
+def test_read_blob_small_fastpath_client_error(s3_object_store, bytes_buffer):
+    s3_object_store.s3_client.get_object.side_effect = _client_error("GetObject")
+
+    with pytest.raises(BlobError):
+        s3_object_store.read_blob("test/doc_ids", bytes_buffer, size_hint=7)
+
+    s3_object_store.s3_client.get_object.assert_called_once()
+
+
+def test_read_blob_large_size_hint_uses_transfer_manager(s3_object_store, bytes_buffer):
+    size_hint = s3_object_store.download_transfer_config["multipart_threshold"] + 1
+    s3_object_store.read_blob("test/path", bytes_buffer, size_hint=size_hint)
+
+    s3_object_store.s3_client.download_fileobj.assert_called_once()
+    s3_object_store.s3_client.get_object.assert_not_called()
+
+
+def test_read_blobs_parallel(s3_object_store):
+    # Each read blocks until the other has started; a sequential implementation times out
+    barrier = Barrier(2, timeout=5)
+    buffers = [BytesIO(), BytesIO()]
+    with patch.object(
+        s3_object_store, "read_blob", side_effect=lambda *args, **kwargs: barrier.wait()
+    ) as mock_read_blob:
+        s3_object_store.read_blobs(
+            [("test/vectors", buffers[0], None), ("test/doc_ids", buffers[1], 8)]
         )
-        assert store.s3_client.upload_fileobj.call_args.args == (
-            bytes_buffer,
-            store.bucket,
-            "remote/path",
+
+    assert sorted(mock_read_blob.call_args_list) == [
+        call("test/doc_ids", buffers[1], size_hint=8),
+        call("test/vectors", buffers[0], size_hint=None),
+    ]
+
+
+def test_read_blobs_uses_kms_key_of_first_blob(s3_object_store):
+    keys = {"test/vectors": "vector-key", "test/doc_ids": "doc-id-key"}
+
+    def head_object(Bucket, Key):
+        # if both reads checked the key concurrently, the slower doc id HEAD would
+        # overwrite the vector key
+        time.sleep(0.05 if Key == "test/doc_ids" else 0.01)
+        return {"SSEKMSKeyId": keys[Key]}
+
+    s3_object_store.s3_client.head_object.side_effect = head_object
+
+    s3_object_store.read_blobs(
+        [("test/vectors", BytesIO(), None), ("test/doc_ids", BytesIO(), None)]
+    )
+
+    assert s3_object_store.upload_args["SSEKMSKeyId"] == "vector-key"
+    assert s3_object_store.upload_args["ServerSideEncryption"] == "aws:kms"
+    # the key is known once the vector object is checked, so the doc id HEAD is skipped
+    s3_object_store.s3_client.head_object.assert_called_once_with(
+        Bucket=s3_object_store.bucket, Key="test/vectors"
+    )
+
+
+def test_read_blobs_checks_each_unencrypted_blob_once(s3_object_store):
+    s3_object_store.s3_client.head_object.return_value = {}
+
+    s3_object_store.read_blobs(
+        [("test/vectors", BytesIO(), None), ("test/doc_ids", BytesIO(), None)]
+    )
+
+    assert "SSEKMSKeyId" not in s3_object_store.upload_args
+    checked_keys = [
+        kwargs["Key"]
+        for _, kwargs in s3_object_store.s3_client.head_object.call_args_list
+    ]
+    assert sorted(checked_keys) == ["test/doc_ids", "test/vectors"]
+
+
+def test_read_blobs_failure(s3_object_store):
+    s3_object_store.s3_client.download_fileobj.side_effect = _client_error(
+        "DownloadFileObj"
+    )
+    with pytest.raises(BlobError):
+        s3_object_store.read_blobs(
+            [("test/vectors", BytesIO(), None), ("test/doc_ids", BytesIO(), None)]
         )
+    assert s3_object_store.s3_client.download_fileobj.call_count == 2
+
+
+def test_read_blob_unsupported_transfer_config_param(
+    index_build_parameters, object_store_config, bytes_buffer
+):
+    object_store_config["download_transfer_config"] = {"param": "value"}
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    with pytest.raises(BlobError):
+        store.read_blob("test/path", bytes_buffer)
+    store.s3_client.download_fileobj.assert_not_called()
+
+
+def test_write_blob_from_disk_success(index_build_parameters, object_store_config):
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.upload_file = Mock()
+    store.write_blob("local/path", "remote/path")
+
+    store.s3_client.upload_file.assert_called_once()
+    assert isinstance(
+        store.s3_client.upload_file.call_args.kwargs["Config"], TransferConfig
+    )
+    # validate a transfer config parameter matches the object_store_config parameter
+    assert (
+        store.s3_client.upload_file.call_args.kwargs["Config"].__dict__[
+            "max_concurrency"
+        ]
+        == store.upload_transfer_config["max_concurrency"]
+    )
+    assert store.s3_client.upload_file.call_args.kwargs["Callback"] is None
+    assert (
+        store.s3_client.upload_file.call_args.kwargs["ExtraArgs"] == store.upload_args
+    )
+    assert store.s3_client.upload_file.call_args.args == (
+        "local/path",
+        store.bucket,
+        "remote/path",
+    )
+
+
+def test_write_blob_from_buffer_success(index_build_parameters, object_store_config):
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.upload_file = Mock()
+    bytes_buffer = BytesIO()
+    store.write_blob(bytes_buffer, "remote/path")
+
+    store.s3_client.upload_fileobj.assert_called_once()
+    assert isinstance(
+        store.s3_client.upload_fileobj.call_args.kwargs["Config"], TransferConfig
+    )
+    # validate a transfer config parameter matches the object_store_config parameter
+    assert (
+        store.s3_client.upload_fileobj.call_args.kwargs["Config"].__dict__[
+            "max_concurrency"
+        ]
+        == store.upload_transfer_config["max_concurrency"]
+    )
+    assert store.s3_client.upload_fileobj.call_args.kwargs["Callback"] is None
+    assert (
+        store.s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        == store.upload_args
+    )
+    assert store.s3_client.upload_fileobj.call_args.args == (
+        bytes_buffer,
+        store.bucket,
+        "remote/path",
+    )
 
 
 def test_write_blob_with_debug(index_build_parameters, object_store_config):
     object_store_config["debug"] = True
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        store.s3_client.upload_file = Mock()
+    store = S3ObjectStore(index_build_parameters, object_store_config)
+    store.s3_client.upload_file = Mock(
+        side_effect=_report_progress(store, "_write_progress")
+    )
 
-        store.write_blob("local/path", "remote/path")
+    store.write_blob("local/path", "remote/path")
 
-        # Verify callback was passed
-        callback = store.s3_client.upload_file.call_args.kwargs["Callback"]
-        assert callback is not None
-        # Test the callback directly
-        assert store._write_progress == 0
-        callback(100)  # Simulate 100 bytes transferred
-        assert store._write_progress == 100
-        callback(50)  # Simulate 50 more bytes
-        assert store._write_progress == 150
+    # Verify callback was passed
+    assert store.s3_client.upload_file.call_args.kwargs["Callback"] is not None
+    # the bytes held back below the report interval are published when the upload ends
+    assert store._write_progress == PROGRESS_REPORT_INTERVAL_BYTES + 50
 
 
-def test_write_blob_client_error_failure(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        error = ClientError(
-            {"Error": {"Code": "LimitExceededException", "Message": "Limit Exceeded"}},
-            "UploadFile",
-        )
-        store.s3_client.upload_file.side_effect = error
-        with pytest.raises(BlobError):
-            store.write_blob("local/path", "remote/path")
+def _client_error(operation_name):
+    return ClientError(
+        {"Error": {"Code": "LimitExceededException", "Message": "Limit Exceeded"}},
+        operation_name,
+    )
 
 
-def test_write_blob_type_error_failure(index_build_parameters, object_store_config):
-    with patch("core.object_store.s3.s3_object_store.get_boto3_client"):
-        store = S3ObjectStore(index_build_parameters, object_store_config)
-        error = TypeError(
-            "TransferConfig.__init__() got an unexpected keyword argument"
-        )
-        store.s3_client.upload_file.side_effect = error
-        with pytest.raises(BlobError):
-            store.write_blob("local/path", "remote/path")
+TRANSFER_CONFIG_TYPE_ERROR = TypeError(
+    "TransferConfig.__init__() got an unexpected keyword argument"
+)
+
+
+@pytest.mark.parametrize(
+    "client_method, error",
+    [
+        pytest.param(
+            "download_fileobj", _client_error("DownloadFileObj"), id="read-client"
+        ),
+        pytest.param("download_fileobj", TRANSFER_CONFIG_TYPE_ERROR, id="read-type"),
+        pytest.param(
+            "download_fileobj",
+            EndpointConnectionError(endpoint_url="https://s3"),
+            id="read-botocore",
+        ),
+        pytest.param("upload_file", _client_error("UploadFile"), id="write-client"),
+        pytest.param("upload_file", TRANSFER_CONFIG_TYPE_ERROR, id="write-type"),
+    ],
+)
+def test_blob_transfer_failure(s3_object_store, bytes_buffer, client_method, error):
+    getattr(s3_object_store.s3_client, client_method).side_effect = error
+    with pytest.raises(BlobError):
+        if client_method == "download_fileobj":
+            s3_object_store.read_blob("test/path", bytes_buffer)
+        else:
+            s3_object_store.write_blob("local/path", "remote/path")
@@ -0,0 +1,92 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+import os
+
+import numpy as np
+import pytest
+from core.preallocated_bytes_io import BufferCapacityError, PreallocatedBytesIO
+
+DATA = bytes(range(64))
+
+
+def test_sequential_writes():
+    buffer = PreallocatedBytesIO(len(DATA))
+    assert buffer.write(DATA[:10]) == 10
+    assert buffer.write(memoryview(DATA)[10:]) == len(DATA) - 10
+    assert buffer.tell() == len(DATA)
+    assert bytes(buffer.getbuffer()) == DATA
+
+
+def test_out_of_order_ranged_writes():
+    buffer = PreallocatedBytesIO(len(DATA))
+    for start in (48, 0, 32, 16):
+        buffer.seek(start)
+        buffer.write(DATA[start : start + 16])
+    assert bytes(buffer.getbuffer()) == DATA
+
+
+def test_getbuffer_is_limited_to_written_bytes():
+    buffer = PreallocatedBytesIO(len(DATA))
+    buffer.write(DATA[:20])
+    view = buffer.getbuffer()
+    assert len(view) == 20
+    # the view aliases the preallocated array rather than copying it
+    assert np.shares_memory(np.frombuffer(view, dtype=np.uint8), buffer._array)
+
+
+def test_seek_whence():
+    buffer = PreallocatedBytesIO(len(DATA))
+    buffer.write(DATA[:20])
+    assert buffer.seek(-5, os.SEEK_CUR) == 15
+    assert buffer.seek(0, os.SEEK_END) == 20
+    with pytest.raises(ValueError):
+        buffer.seek(0, 3)
+
+
+def test_write_past_capacity():
+    buffer = PreallocatedBytesIO(8)
+    buffer.seek(4)
+    with pytest.raises(BufferCapacityError):
+        buffer.write(DATA[:5])
+
+
+def test_read_side_uses_written_bytes():
+    buffer = PreallocatedBytesIO(len(DATA))
+    buffer.write(DATA[:40])
+    assert buffer.getvalue() == DATA[:40]
+
+    buffer.seek(10)
+    assert buffer.read(5) == DATA[10:15]
+    assert buffer.read() == DATA[15:40]
+    assert buffer.read() == b""
+
+    buffer.seek(0)
+    target = bytearray(16)
+    assert buffer.readinto(target) == 16
+    assert bytes(target) == DATA[:16]
+
+
+def test_truncate():
+    buffer = PreallocatedBytesIO(len(DATA))
+    buffer.write(DATA)
+    buffer.seek(20)
+    assert buffer.truncate() == 20
+    assert buffer.getvalue() == DATA[:20]
+    # truncating past the written size leaves it unchanged
+    assert buffer.truncate(30) == 30
+    assert buffer.getvalue() == DATA[:20]
+
+
+def test_close_releases_array():
+    buffer = PreallocatedBytesIO(len(DATA))
+    buffer.write(DATA)
+    view = buffer.getbuffer()
+    buffer.close()
+    assert buffer.closed
+    assert len(buffer._array) == 0
+    # views handed out before closing remain valid
+    assert bytes(view) == DATA
@@ -6,6 +6,7 @@
 # compatible open source license.
 
 from io import BytesIO
+from threading import Barrier
 from unittest.mock import Mock, patch
 import tempfile
 import os
@@ -13,6 +14,7 @@ import os
 import numpy as np
 import pytest
 from core.tasks import (
+    _determine_streaming_buffer,
     TaskResult,
     build_index,
     create_vectors_dataset,
@@ -20,16 +22,32 @@ from core.tasks import (
     upload_index,
     index_storage_context,
 )
-from core.common.exceptions import BlobError
+from core.common.exceptions import BlobError, VectorsDatasetError
 from core.common.models.vectors_dataset import VectorsDataset
 from core.object_store.object_store import ObjectStore
+from core.preallocated_bytes_io import PreallocatedBytesIO
+from core.fp32_to_fp16_converting_bytes_io import FP32ToFP16ConvertingBytesIO
 from core.common.models.index_build_parameters import DataType
 from core.common.models.index_build_parameters import IndexSerializationMode
 
 
+# Spec'd mocks are built once per module, since Mock(spec=...) introspects the class on every
+# construction, and reset after each test so configured results and recorded calls do not leak
+@pytest.fixture(scope="module")
+def _module_object_store():
+    return Mock(spec_set=ObjectStore)
+
+
 @pytest.fixture
-def mock_object_store():
-    return Mock(spec=ObjectStore)
+def mock_object_store(_module_object_store):
+    # Bulk reads fan out to the mocked read_blob, as the base class implementation does
+    _module_object_store.read_blobs.side_effect = (
+        lambda items, **kwargs: ObjectStore.read_blobs(
+            _module_object_store, items, **kwargs
+        )
+    )
+    yield _module_object_store
+    _module_object_store.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -44,8 +62,8 @@ def mock_vectors_dataset_parse():
         yield mock
 
 
-@pytest.fixture
-def mock_vectors_dataset():
+@pytest.fixture(scope="module")
+def _module_vectors_dataset():
     return Mock(
         spec=VectorsDataset,
         vectors=np.array([]),
@@ -54,6 +72,12 @@ def mock_vectors_dataset():
     )
 
 
+@pytest.fixture
+def mock_vectors_dataset(_module_vectors_dataset):
+    yield _module_vectors_dataset
+    _module_vectors_dataset.reset_mock(return_value=True, side_effect=True)
+
+
 def test_download_blob_error_handling(
     mock_object_store_factory,
     mock_object_store,
@@ -77,6 +101,102 @@ def test_download_blob_error_handling(
     doc_ids.close()
 
 
+def test_create_vectors_dataset_reads_blobs_concurrently(
+    mock_vectors_dataset_parse, mock_object_store, index_build_parameters
+):
+    # Each read blocks until the other has started; a sequential implementation times out
+    barrier = Barrier(2, timeout=5)
+    mock_object_store.read_blob.side_effect = lambda path, buffer, **kwargs: (
+        barrier.wait()
+    )
+
+    create_vectors_dataset(
+        index_build_parameters, mock_object_store, BytesIO(), BytesIO()
+    )
+
+    read_paths = {call.args[0] for call in mock_object_store.read_blob.call_args_list}
+    assert read_paths == {
+        index_build_parameters.vector_path,
+        index_build_parameters.doc_id_path,
+    }
+    mock_vectors_dataset_parse.assert_called_once()
+
+
+def test_create_vectors_dataset_preallocates_vector_buffer(
+    mock_object_store, index_build_parameters, sample_vectors_bytes, sample_doc_ids
+):
+    def read_blob(path, buffer, size_hint=None):
+        if path == index_build_parameters.vector_path:
+            buffer.write(sample_vectors_bytes)
+        else:
+            buffer.write(sample_doc_ids.tobytes())
+
+    mock_object_store.read_blob.side_effect = read_blob
+
+    dataset = create_vectors_dataset(
+        index_build_parameters, mock_object_store, None, BytesIO()
+    )
+
+    buffers = {
+        path: buffer
+        for path, buffer, _ in mock_object_store.read_blobs.call_args.args[0]
+    }
+    vector_buffer = buffers[index_build_parameters.vector_path]
+    # The download goes straight into a buffer sized for the dataset, not a growing BytesIO
+    assert type(vector_buffer) is PreallocatedBytesIO
+    assert vector_buffer._array.nbytes == (
+        index_build_parameters.doc_count
+        * index_build_parameters.dimension
+        * np.dtype(np.float32).itemsize
+    )
+    assert dataset.vectors.shape == (
+        index_build_parameters.doc_count,
+        index_build_parameters.dimension,
+    )
+    assert dataset.vectors.tobytes() == sample_vectors_bytes
+    # Parsing views the downloaded bytes in place rather than copying them
+    assert np.shares_memory(dataset.vectors, vector_buffer._array)
+    dataset.free_vectors_space()
+
+
+def test_determine_streaming_buffer_reuses_fp16_buffer(index_build_parameters):
+    fp16_params = index_build_parameters.model_copy(
+        update={"data_type": DataType.FLOAT16}
+    )
+    buffer = _determine_streaming_buffer(fp16_params, None)
+    assert isinstance(buffer, FP32ToFP16ConvertingBytesIO)
+    assert _determine_streaming_buffer(fp16_params, buffer) is buffer
+
+
+def test_create_vectors_dataset_oversized_vector_blob(
+    mock_object_store, index_build_parameters, sample_vectors_bytes, sample_doc_ids
+):
+    def read_blob(path, buffer, size_hint=None):
+        if path == index_build_parameters.vector_path:
+            buffer.write(sample_vectors_bytes + b"\x00" * 4)
+        else:
+            buffer.write(sample_doc_ids.tobytes())
+
+    mock_object_store.read_blob.side_effect = read_blob
+
+    with pytest.raises(VectorsDatasetError):
+        create_vectors_dataset(
+            index_build_parameters, mock_object_store, None, BytesIO()
+        )
+
+
+def test_create_vectors_dataset_does_not_relabel_other_value_errors(
+    mock_object_store, index_build_parameters
+):
+    mock_object_store.read_blob.side_effect = ValueError("unrelated")
+
+    # VectorsDatasetError is not a ValueError, so a relabelled error fails this check
+    with pytest.raises(ValueError, match="unrelated"):
+        create_vectors_dataset(
+            index_build_parameters, mock_object_store, None, BytesIO()
+        )
+
+
 def test_successful_object_store_creation(
     mock_object_store_factory,
     mock_vectors_dataset_parse,
@@ -130,6 +250,17 @@ def test_successful_upload(
     mock_object_store.write_blob.assert_called_once_with(local_path, remote_path)
 
 
+def test_upload_index_path_keeps_inner_dots(mock_object_store, index_build_parameters):
+    params = index_build_parameters.model_copy(
+        update={"vector_path": "dir.v1/vec.part.knnvec"}
+    )
+
+    remote_path = upload_index(params, mock_object_store, "/tmp/index")
+
+    assert remote_path == "dir.v1/vec.part." + params.engine
+    mock_object_store.write_blob.assert_called_once_with("/tmp/index", remote_path)
+
+
 def test_upload_blob_error_handling(
     mock_object_store_factory,
     mock_object_store,
@@ -169,10 +300,51 @@ def test_successful_task_execution(
         # Verify mock calls
         mock_create_dataset.assert_called_once()
         mock_upload_index.assert_called_once()
-        assert mock_vectors_dataset.free_vectors_space.call_count == 2
+        mock_vectors_dataset.free_vectors_space.assert_called_once()
         mock_os_makedirs.assert_called_once()
 
 
+def test_task_execution_closes_vector_buffer(
+    index_build_parameters, mock_vectors_dataset, object_store_config
+):
+    with (
+        patch("core.tasks.create_vectors_dataset") as mock_create_dataset,
+        patch("core.tasks.upload_index", return_value="remote/path/to/index.bin"),
+    ):
+        mock_create_dataset.return_value = mock_vectors_dataset
+        result = run_tasks(index_build_parameters, object_store_config)
+
+    assert result.error is None
+    vector_buffer = mock_create_dataset.call_args.kwargs["vector_bytes_buffer"]
+    assert isinstance(vector_buffer, PreallocatedBytesIO)
+    assert vector_buffer.closed
+
+
+def test_task_execution_creates_one_boto3_client(
+    index_build_parameters, mock_vectors_dataset, object_store_config
+):
+    with (
+        patch("core.object_store.s3.s3_object_store.get_boto3_client") as mock_client,
+        patch("core.tasks.VectorsDataset.parse", return_value=mock_vectors_dataset),
+        patch("core.tasks.FaissIndexBuildService"),
+    ):
+        mock_client.return_value.get_object.return_value = {
+            "Body": BytesIO(),
+            "ContentLength": 0,
+        }
+        result = run_tasks(
+            index_build_parameters, object_store_config, IndexSerializationMode.MEMORY
+        )
+
+    assert result.error is None
+    # downloads and the upload all go through the same object store and client
+    mock_client.assert_called_once_with(object_store_config["s3_client_config"])
+    # the vectors use the transfer manager, the small doc id blob a single GetObject
+    mock_client.return_value.download_fileobj.assert_called_once()
+    mock_client.return_value.get_object.assert_called_once()
+    mock_client.return_value.upload_fileobj.assert_called_once()
+
+
 def test_successful_task_execution_with_memory_storage_mode(
     index_build_parameters,
     mock_vectors_dataset,
@@ -203,7 +375,7 @@ def test_successful_task_execution_with_memory_storage_mode(
         assert "object_store" in call_args
 
         mock_upload_index.assert_called_once()
-        assert mock_vectors_dataset.free_vectors_space.call_count == 2
+        mock_vectors_dataset.free_vectors_space.assert_called_once()
 
 
 def test_create_vectors_dataset_failure(index_build_parameters, object_store_config):
@@ -267,3 +439,12 @@ def test_disk_mode():
             assert os.path.getsize(storage) > 0
         # check that file got cleaned up
         assert not os.path.exists(storage)
+
+
+def test_disk_mode_without_index_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with index_storage_context(
+            IndexSerializationMode.DISK, temp_dir, "sub/test.knnvec"
+        ) as storage:
+            pass
+        assert not os.path.exists(storage)